@@ -13,23 +13,33 @@ import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 import tempfile
 import os
+import io
 import re
 import zipfile
-import pandas as pd
+import xlsxwriter
 from datetime import datetime
-from docx import Document
+from lxml import etree
 import json
 import configparser
 import sys
 import ctypes
 import threading
-import shutil
+import queue
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
 from pathlib import Path
 import traceback
 import platform
 import logging
 import time
-from typing import Dict, List, Tuple, Optional, Any
+import bisect
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None  # Token matching falls back to a combined regex
+from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, List, Tuple, Optional, Any, Final
 
 # DPI awareness and console hiding for Windows
 if platform.system() == "Windows":
@@ -39,45 +49,102 @@ if platform.system() == "Windows":
     except:
         pass
 
-class ModernColors:
-    """Premium color palette matching Document Tools Suite exactly"""
-    BG_PRIMARY = "#0A0E1A"      # Dark background
-    BG_SECONDARY = "#0F1419"     # Darker variation
-    
-    GLASS_BG = "#1A1D29"        # Glass effect backgrounds
-    GLASS_BORDER = "#2A2D3A"    # Glass borders
-    GLASS_HOVER = "#1F2235"     # Glass hover state
-    
-    CARD_BG = "#161925"         # Card backgrounds
-    CARD_BORDER = "#252837"     # Card borders
-    CARD_HOVER = "#1C1F2E"      # Card hover state
-    
-    PRIMARY = "#2563EB"         # Blue theme
-    PRIMARY_HOVER = "#1D4ED8"   # Darker blue for hover
-    SUCCESS = "#10B981"         # Green theme
-    SUCCESS_HOVER = "#059669"   # Darker green for hover
-    WARNING = "#C56C86"         # Pink tone for warnings
-    ERROR = "#FF7582"           # Coral red for errors
-    
-    TEXT_PRIMARY = "#FFFFFF"    # Pure white text 
-    TEXT_SECONDARY = "#E5E7EB"  # Light gray
-    TEXT_TERTIARY = "#C5A7A7"   # Warm gray with pink undertone 
-    TEXT_MUTED = "#8B7D8B"      # Muted purple-gray 
-    
-    FOCUS_RING = "#2563EB"      # Blue focus ring
-    
-    # Gradient colors for decorative elements
-    GRADIENT_1 = "#2563EB"      # Blue
-    GRADIENT_2 = "#725A7A"      # Purple
-    GRADIENT_3 = "#10B981"      # Green
-    GRADIENT_4 = "#FF7582"      # Coral
+# Premium color palette matching Document Tools Suite exactly
+BG_PRIMARY: Final = "#0A0E1A"      # Dark background
+BG_SECONDARY: Final = "#0F1419"     # Darker variation
+
+GLASS_BG: Final = "#1A1D29"        # Glass effect backgrounds
+GLASS_BORDER: Final = "#2A2D3A"    # Glass borders
+GLASS_HOVER: Final = "#1F2235"     # Glass hover state
+
+CARD_BG: Final = "#161925"         # Card backgrounds
+CARD_BORDER: Final = "#252837"     # Card borders
+CARD_HOVER: Final = "#1C1F2E"      # Card hover state
+
+PRIMARY: Final = "#2563EB"         # Blue theme
+PRIMARY_HOVER: Final = "#1D4ED8"   # Darker blue for hover
+SUCCESS: Final = "#10B981"         # Green theme
+SUCCESS_HOVER: Final = "#059669"   # Darker green for hover
+WARNING: Final = "#C56C86"         # Pink tone for warnings
+ERROR: Final = "#FF7582"           # Coral red for errors
+
+TEXT_PRIMARY: Final = "#FFFFFF"    # Pure white text 
+TEXT_SECONDARY: Final = "#E5E7EB"  # Light gray
+TEXT_TERTIARY: Final = "#C5A7A7"   # Warm gray with pink undertone 
+TEXT_MUTED: Final = "#8B7D8B"      # Muted purple-gray 
+
+FOCUS_RING: Final = "#2563EB"      # Blue focus ring
+
+# Gradient colors for decorative elements
+GRADIENT_1: Final = "#2563EB"      # Blue
+GRADIENT_2: Final = "#725A7A"      # Purple
+GRADIENT_3: Final = "#10B981"      # Green
+GRADIENT_4: Final = "#FF7582"      # Coral
+
+# Starter token file written by the "Template" button
+DEFAULT_TOKEN_TEMPLATE: Dict[str, str] = {
+    "<<FileService.": "Fileservice",
+    "</ff>": "Page Break",
+    "</pp>": "Hard Return",
+    "<backspace>": "Backspace",
+    "<<STNDRDTH": "STNDRD Add \"TH\"",
+    "<c>": "Center",
+    "<u>": "Underline",
+    "<i>": "Italic",
+    "<pcase>": "pcase",
+    "<lcase>": "lcase",
+    "<ucase>": "ucase",
+    "<bold>": "Bold",
+    "<nobullet>": "No Bullet",
+    "<fontsize": "Font Size",
+    "<s1>": "s1",
+    "<s2>": "s2",
+    "[[MCOMPUTEINTO(<<": "MCOMPUTE INTO",
+    "[[SCOMPUTEINTO(": "SCOMPUTE INTO",
+    "[[ABORTIIF": "Abortif",
+    "PROMTINTO(": "PROMTINTO",
+    "PROMTINTOIIF(": "PROMTINTOIIF",
+    "PROMTINTOLIST(": "PROMTINTOLIST",
+    "PROMTINTOIIFLIST(": "PROMTINTOIIFLIST",
+    "PROMTFORM(": "PROMTFORM",
+    "<<Checklist.": "CHECKLIST",
+    "TABLE(": "TABLE",
+    "<<jfig": "JFIG",
+    "jfig": "JFIG_General",
+    "{ATTY": "ESIGN",
+    "<<Special.": "SPECIAL",
+    "+91|<<Special.ToDay": "+91 special day",
+    "-91|<<Special.ToDay": "-91 special day",
+    "+2|<<Special.ToDay": "+2 special day",
+    "-2|<<Special.ToDay": "-2 special day",
+    "<<Tracker.MortDate>>~MMMM dd": "MMMM dd,yyyy",
+    "<<Tracker.MortDate>>~MM-dd-yyyy": "MM-dd-yyyy",
+    "<<Tracker.MortDate>>~ddd": "ddd,MMM dd-yyyy",
+    "<<Tracker.OriginalPrincipal>>~##": "##,###,###.00",
+    "CU$TOMMMMMMPLACEHOLDER": "Custom(Enter Below)"
+}
+
+@lru_cache(maxsize=None)
+def _system_font():
+    """Platform UI font family, resolved once per process"""
+    fonts = {
+        "Darwin": "SF Pro Display",
+        "Windows": "Segoe UI",
+        "Linux": "Ubuntu"
+    }
+    return fonts.get(platform.system(), "Arial")
+
+@lru_cache(maxsize=None)
+def _font(size, weight="normal"):
+    """Shared font tuple so identical fonts resolve to one Tk font"""
+    return (_system_font(), size, weight)
 
 class BlurredBackground(tk.Canvas):
     """Creates a gradient background effect"""
     
     def __init__(self, parent, width, height):
         super().__init__(parent, width=width, height=height, highlightthickness=0, bd=0)
-        self.configure(bg=ModernColors.BG_PRIMARY)
+        self.configure(bg=BG_PRIMARY)
         self.width = width
         self.height = height
         self.create_gradient_background()
@@ -92,9 +159,9 @@ class BlurredBackground(tk.Canvas):
             self.create_line(0, i, self.width, i, fill=color, width=1)
         
         # Add decorative circles with sunset colors on dark background
-        self.create_blur_circle(120, 80, 50, ModernColors.GRADIENT_1)      # Blue
-        self.create_blur_circle(self.width - 100, 150, 40, ModernColors.GRADIENT_3)  # Pink
-        self.create_blur_circle(250, self.height - 120, 60, ModernColors.GRADIENT_2)  # Purple
+        self.create_blur_circle(120, 80, 50, GRADIENT_1)      # Blue
+        self.create_blur_circle(self.width - 100, 150, 40, GRADIENT_3)  # Pink
+        self.create_blur_circle(250, self.height - 120, 60, GRADIENT_2)  # Purple
 
     def create_blur_circle(self, x, y, radius, color):
         """Create decorative circle with specified color"""
@@ -105,9 +172,9 @@ class BlurredBackground(tk.Canvas):
                 if i == 0:
                     alpha_color = color
                 elif i == 1:
-                    alpha_color = ModernColors.GRADIENT_2
+                    alpha_color = GRADIENT_2
                 else:
-                    alpha_color = ModernColors.GRADIENT_4
+                    alpha_color = GRADIENT_4
                     
                 self.create_oval(x - r, y - r, x + r, y + r,
                                fill=alpha_color, outline="", stipple="gray25")
@@ -118,28 +185,18 @@ class ModernCard(tk.Frame):
     def __init__(self, parent, title, width=None, height=None):
         super().__init__(parent)
         self.title = title
-        self.font_family = self.get_system_font()
         
         self.setup_card(width, height)
         self.create_header()
     
-    def get_system_font(self):
-        system = platform.system()
-        fonts = {
-            "Darwin": "SF Pro Display",
-            "Windows": "Segoe UI",
-            "Linux": "Ubuntu"
-        }
-        return fonts.get(system, "Arial")
-    
     def setup_card(self, width, height):
         """Setup card styling"""
         self.configure(
-            bg=ModernColors.CARD_BG,
+            bg=CARD_BG,
             relief="flat",
             bd=0,
             highlightthickness=1,
-            highlightbackground=ModernColors.CARD_BORDER
+            highlightbackground=CARD_BORDER
         )
         
         if width and height:
@@ -148,20 +205,20 @@ class ModernCard(tk.Frame):
     
     def create_header(self):
         """Create card header"""
-        header_frame = tk.Frame(self, bg=ModernColors.CARD_BG)
+        header_frame = tk.Frame(self, bg=CARD_BG)
         header_frame.pack(fill=tk.X, padx=16, pady=(12, 8))
         
         # Title
         tk.Label(header_frame, text=self.title,
-                font=(self.font_family, 14, "bold"),
-                bg=ModernColors.CARD_BG,
-                fg=ModernColors.TEXT_PRIMARY).pack(side=tk.LEFT)
+                font=_font(14, "bold"),
+                bg=CARD_BG,
+                fg=TEXT_PRIMARY).pack(side=tk.LEFT)
         
         # Status dot with sunset accent
         tk.Label(header_frame, text="●",
                 font=("Arial", 8),
-                fg=ModernColors.GRADIENT_3,  # Pink accent dot
-                bg=ModernColors.CARD_BG).pack(side=tk.RIGHT)
+                fg=GRADIENT_3,  # Pink accent dot
+                bg=CARD_BG).pack(side=tk.RIGHT)
     
     def add_content(self, content_widget):
         """Add content to the card"""
@@ -171,24 +228,22 @@ class ModernButton(tk.Button):
     """Modern styled button"""
     
     def __init__(self, parent, text, command, style="primary", **kwargs):
-        self.font_family = self.get_system_font()
-        
         # Style configurations with sunset theme
         styles = {
             "primary": {
-                "bg": ModernColors.PRIMARY,         # Rich blue #355C7D
-                "hover_bg": ModernColors.PRIMARY_HOVER,
+                "bg": PRIMARY,         # Rich blue #355C7D
+                "hover_bg": PRIMARY_HOVER,
                 "fg": "white"
             },
             "success": {
-                "bg": ModernColors.GRADIENT_3,      # Pink
+                "bg": GRADIENT_3,      # Pink
                 "hover_bg": "#B85A7A",              # Darker pink
                 "fg": "white"
             },
             "secondary": {
-                "bg": ModernColors.GLASS_BG,
-                "hover_bg": ModernColors.GLASS_HOVER,
-                "fg": ModernColors.TEXT_PRIMARY
+                "bg": GLASS_BG,
+                "hover_bg": GLASS_HOVER,
+                "fg": TEXT_PRIMARY
             }
         }
         
@@ -198,7 +253,7 @@ class ModernButton(tk.Button):
             parent,
             text=text,
             command=command,
-            font=(self.font_family, 12, "bold"),
+            font=_font(12, "bold"),
             bg=config["bg"],
             fg=config["fg"],
             activebackground=config["bg"],
@@ -217,15 +272,6 @@ class ModernButton(tk.Button):
         self.bind("<Enter>", self.on_enter)
         self.bind("<Leave>", self.on_leave)
     
-    def get_system_font(self):
-        system = platform.system()
-        fonts = {
-            "Darwin": "SF Pro Display",
-            "Windows": "Segoe UI",
-            "Linux": "Ubuntu"
-        }
-        return fonts.get(system, "Arial")
-    
     def on_enter(self, event):
         self.configure(bg=self.hover_bg)
     
@@ -236,40 +282,30 @@ class ModernEntry(tk.Frame):
     """Modern styled entry with label"""
     
     def __init__(self, parent, label, variable=None, **kwargs):
-        super().__init__(parent, bg=ModernColors.BG_PRIMARY)
-        self.font_family = self.get_system_font()
+        super().__init__(parent, bg=BG_PRIMARY)
         self.variable = variable
         
         # Label
         tk.Label(self, text=label,
-                font=(self.font_family, 10, "bold"),
-                bg=ModernColors.BG_PRIMARY,
-                fg=ModernColors.TEXT_PRIMARY).pack(anchor="w", pady=(0, 3))
+                font=_font(10, "bold"),
+                bg=BG_PRIMARY,
+                fg=TEXT_PRIMARY).pack(anchor="w", pady=(0, 3))
         
         # Entry
-        entry_frame = tk.Frame(self, bg=ModernColors.CARD_BORDER, bd=1)
+        entry_frame = tk.Frame(self, bg=CARD_BORDER, bd=1)
         entry_frame.pack(fill=tk.X)
         
         self.entry = tk.Entry(entry_frame,
                              textvariable=variable,
-                             font=(self.font_family, 10),
-                             bg=ModernColors.BG_SECONDARY,  # Much darker background
-                             fg=ModernColors.TEXT_PRIMARY,
-                             insertbackground=ModernColors.TEXT_PRIMARY,
+                             font=_font(10),
+                             bg=BG_SECONDARY,  # Much darker background
+                             fg=TEXT_PRIMARY,
+                             insertbackground=TEXT_PRIMARY,
                              relief="flat",
                              bd=0,
                              **kwargs)
         self.entry.pack(fill=tk.X, ipady=6, ipadx=10)
     
-    def get_system_font(self):
-        system = platform.system()
-        fonts = {
-            "Darwin": "SF Pro Display",
-            "Windows": "Segoe UI",
-            "Linux": "Ubuntu"
-        }
-        return fonts.get(system, "Arial")
-    
     def get(self):
         return self.entry.get() if not self.variable else self.variable.get()
 
@@ -277,97 +313,34 @@ class ModernCombobox(tk.Frame):
     """Modern styled combobox with label"""
     
     def __init__(self, parent, label, variable=None, values=None, **kwargs):
-        super().__init__(parent, bg=ModernColors.BG_PRIMARY)
-        self.font_family = self.get_system_font()
+        super().__init__(parent, bg=BG_PRIMARY)
         
         # Labelt
         tk.Label(self, text=label,
-                font=(self.font_family, 10, "bold"),
-                bg=ModernColors.BG_PRIMARY,
-                fg=ModernColors.TEXT_PRIMARY).pack(anchor="w", pady=(0, 3))
-        
-        # Get the global style
-        style = ttk.Style()
-        
-        # Force override all combobox styling
-        style.configure("TCombobox",
-                       fieldbackground=ModernColors.BG_SECONDARY,
-                       background=ModernColors.BG_SECONDARY,
-                       foreground=ModernColors.TEXT_PRIMARY,
-                       borderwidth=1,
-                       relief="flat",
-                       selectbackground=ModernColors.PRIMARY,
-                       selectforeground="white",
-                       arrowcolor=ModernColors.TEXT_PRIMARY,
-                       insertcolor=ModernColors.TEXT_PRIMARY,
-                       lightcolor=ModernColors.BG_SECONDARY,
-                       darkcolor=ModernColors.BG_SECONDARY,
-                       bordercolor=ModernColors.CARD_BORDER,
-                       focuscolor=ModernColors.PRIMARY)
-        
-        # Aggressive state mapping to override everything
-        style.map("TCombobox",
-                 fieldbackground=[("readonly", ModernColors.BG_SECONDARY),
-                                ("active", ModernColors.BG_SECONDARY),
-                                ("focus", ModernColors.BG_SECONDARY),
-                                ("disabled", ModernColors.BG_SECONDARY),
-                                ("pressed", ModernColors.BG_SECONDARY),
-                                ("!readonly", ModernColors.BG_SECONDARY),
-                                ("!focus", ModernColors.BG_SECONDARY),
-                                ("!active", ModernColors.BG_SECONDARY)],
-                 background=[("readonly", ModernColors.BG_SECONDARY),
-                           ("active", ModernColors.BG_SECONDARY),
-                           ("focus", ModernColors.BG_SECONDARY),
-                           ("disabled", ModernColors.BG_SECONDARY),
-                           ("pressed", ModernColors.BG_SECONDARY),
-                           ("!readonly", ModernColors.BG_SECONDARY),
-                           ("!focus", ModernColors.BG_SECONDARY),
-                           ("!active", ModernColors.BG_SECONDARY)],
-                 foreground=[("readonly", ModernColors.TEXT_PRIMARY),
-                           ("active", ModernColors.TEXT_PRIMARY),
-                           ("focus", ModernColors.TEXT_PRIMARY),
-                           ("disabled", ModernColors.TEXT_MUTED),
-                           ("pressed", ModernColors.TEXT_PRIMARY),
-                           ("!readonly", ModernColors.TEXT_PRIMARY)],
-                 bordercolor=[("focus", ModernColors.PRIMARY),
-                            ("active", ModernColors.CARD_BORDER),
-                            ("readonly", ModernColors.CARD_BORDER),
-                            ("!focus", ModernColors.CARD_BORDER)])
+                font=_font(10, "bold"),
+                bg=BG_PRIMARY,
+                fg=TEXT_PRIMARY).pack(anchor="w", pady=(0, 3))
         
         self.combobox = ttk.Combobox(self,
                                     textvariable=variable,
                                     values=values or [],
-                                    font=(self.font_family, 10),
+                                    font=_font(10),
                                     style="TCombobox",  # Use the global style
                                     state="readonly",
                                     **kwargs)
         self.combobox.pack(fill=tk.X, ipady=3)
-        
-        # Force update and apply theme immediately
-        self.combobox.update()
-        self.update_idletasks()
-    
-    def get_system_font(self):
-        system = platform.system()
-        fonts = {
-            "Darwin": "SF Pro Display",
-            "Windows": "Segoe UI",
-            "Linux": "Ubuntu"
-        }
-        return fonts.get(system, "Arial")
 
 class ModernProgressBar(tk.Frame):
     """Modern progress bar with label"""
     
     def __init__(self, parent):
-        super().__init__(parent, bg=ModernColors.BG_PRIMARY)
-        self.font_family = self.get_system_font()
+        super().__init__(parent, bg=BG_PRIMARY)
         
         # Progress label with fixed width to prevent shaking
         self.progress_label = tk.Label(self, text="Ready to scan",
-                                      font=(self.font_family, 11, "bold"),
-                                      bg=ModernColors.BG_PRIMARY,
-                                      fg=ModernColors.TEXT_PRIMARY,
+                                      font=_font(11, "bold"),
+                                      bg=BG_PRIMARY,
+                                      fg=TEXT_PRIMARY,
                                       width=50,  # Fixed width to prevent layout shifts
                                       anchor="w")  # Left align text
         self.progress_label.pack(anchor="w", pady=(0, 6))
@@ -375,11 +348,11 @@ class ModernProgressBar(tk.Frame):
         # Progress bar
         style = ttk.Style()
         style.configure("Modern.Horizontal.TProgressbar",
-                       background=ModernColors.PRIMARY,
-                       troughcolor=ModernColors.CARD_BG,
+                       background=PRIMARY,
+                       troughcolor=CARD_BG,
                        borderwidth=0,
-                       lightcolor=ModernColors.PRIMARY,
-                       darkcolor=ModernColors.PRIMARY)
+                       lightcolor=PRIMARY,
+                       darkcolor=PRIMARY)
         
         self.progress_bar = ttk.Progressbar(self,
                                            style="Modern.Horizontal.TProgressbar",
@@ -387,15 +360,6 @@ class ModernProgressBar(tk.Frame):
                                            maximum=100)  # Set fixed maximum
         self.progress_bar.pack(fill=tk.X, ipady=6)
     
-    def get_system_font(self):
-        system = platform.system()
-        fonts = {
-            "Darwin": "SF Pro Display",
-            "Windows": "Segoe UI",
-            "Linux": "Ubuntu"
-        }
-        return fonts.get(system, "Arial")
-    
     def set_progress(self, value, text=None):
         self.progress_bar["value"] = value
         if text:
@@ -407,20 +371,20 @@ class ModernProgressBar(tk.Frame):
 class ModernTextArea(tk.Frame):
     """Modern text area with scrollbar"""
     
-    def __init__(self, parent, height=10):
-        super().__init__(parent, bg=ModernColors.BG_PRIMARY)
-        self.font_family = self.get_system_font()
+    def __init__(self, parent, height=10, max_lines=5000):
+        super().__init__(parent, bg=BG_PRIMARY)
+        self.max_lines = max_lines
         
         # Create text widget with scrollbar
-        text_frame = tk.Frame(self, bg=ModernColors.CARD_BG)
+        text_frame = tk.Frame(self, bg=CARD_BG)
         text_frame.pack(fill=tk.BOTH, expand=True)
         
         self.text_widget = tk.Text(text_frame,
                                   height=height,
-                                  font=(self.font_family, 10),
-                                  bg=ModernColors.CARD_BG,
-                                  fg=ModernColors.TEXT_PRIMARY,
-                                  insertbackground=ModernColors.TEXT_PRIMARY,
+                                  font=_font(10),
+                                  bg=CARD_BG,
+                                  fg=TEXT_PRIMARY,
+                                  insertbackground=TEXT_PRIMARY,
                                   relief="flat",
                                   bd=0,
                                   wrap=tk.WORD,
@@ -432,32 +396,242 @@ class ModernTextArea(tk.Frame):
         
         self.text_widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-    
-    def get_system_font(self):
-        system = platform.system()
-        fonts = {
-            "Darwin": "SF Pro Display",
-            "Windows": "Segoe UI",
-            "Linux": "Ubuntu"
-        }
-        return fonts.get(system, "Arial")
+        
+        # Pending writes, flushed together on the next idle cycle
+        self._buffer = []
+        self._flush_scheduled = False
     
     def insert(self, text):
+        """Queue text for display; writes are coalesced into one idle flush"""
+        self._buffer.append(text)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.after_idle(self._flush)
+    
+    def _flush(self):
+        """Write all pending text with a single insert"""
+        self._flush_scheduled = False
+        if not self._buffer:
+            return
+        text = "".join(self._buffer)
+        self._buffer.clear()
         self.text_widget.insert(tk.END, text)
+        self.trim(self.max_lines)
         self.text_widget.see(tk.END)
     
+    def trim(self, max_lines):
+        """Drop the oldest lines so the widget keeps at most max_lines"""
+        line_count = int(self.text_widget.index("end-1c").split(".")[0])
+        if line_count > max_lines:
+            self.text_widget.delete("1.0", f"{line_count - max_lines + 1}.0")
+    
     def clear(self):
+        self._buffer.clear()
         self.text_widget.delete(1.0, tk.END)
 
+# WordprocessingML namespace used in word/document.xml
+W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+
+# Any markup tag, and the XML entities Word uses in text runs
+_TAG_RE = re.compile(rb'<[^>]*>')
+_XML_ENTITIES = ((b'&lt;', b'<'), (b'&gt;', b'>'), (b'&quot;', b'"'), (b'&apos;', b"'"), (b'&amp;', b'&'))
+
+def _read_document_xml(path):
+    """Return the raw bytes of word/document.xml"""
+    with zipfile.ZipFile(path) as z:
+        return z.read('word/document.xml')
+
+def _may_contain_tokens(xml, pattern_bytes):
+    """Cheap pre-check: can any token appear in the text of this document.xml?
+    
+    Strips all markup with one regex pass, so tokens split across runs come
+    back together, and looks for each UTF-8 token. It may report false
+    positives but never false negatives.
+    """
+    if xml.startswith((b'\xff\xfe', b'\xfe\xff')):
+        return True  # UTF-16 XML; let the full parse decide
+    text = _TAG_RE.sub(b'', xml)
+    if b'&#' in text:
+        return True  # Numeric character references; let the full parse decide
+    for entity, char in _XML_ENTITIES:
+        text = text.replace(entity, char)
+    return any(token in text for token in pattern_bytes)
+
+def _extract_text(xml):
+    """Extract document text from the bytes of word/document.xml.
+    
+    Streams the XML with lxml instead of building the python-docx object
+    tree. Produces one line per paragraph (table cells included), with tabs
+    and breaks rendered the same way python-docx renders them.
+    """
+    lines = []
+    with io.BytesIO(xml) as f:
+        for _, para in etree.iterparse(f, tag=W + 'p'):
+            parts = []
+            for el in para.iter(W + 't', W + 'tab', W + 'br', W + 'cr'):
+                if el.tag == W + 't':
+                    parts.append(el.text or '')
+                elif el.tag == W + 'tab':
+                    parts.append('\t')
+                else:
+                    parts.append('\n')
+            lines.append(''.join(parts))
+            para.clear()
+    return '\n'.join(lines)
+
+# Distinct matched lines kept per file
+MAX_MATCHED_LINES = 50
+# Matched lines written to a report cell
+MAX_REPORT_LINES = 20
+
+# Per-process matcher state, installed once by _init_worker
+_patterns = []
+_pattern_bytes = []
+_automaton = None
+_combined = None
+_token_ids = {}
+_prefix_ids = []
+
+def _init_worker(patterns):
+    """Build the token matcher for this worker process.
+    
+    Uses an Aho-Corasick automaton when pyahocorasick is installed, otherwise
+    a single compiled regex alternation over all tokens.
+    """
+    global _patterns, _pattern_bytes, _automaton, _combined, _token_ids, _prefix_ids
+    _patterns = patterns
+    _pattern_bytes = [token.encode('utf-8') for token in patterns]
+    if ahocorasick is not None:
+        _automaton = ahocorasick.Automaton()
+        for i, token in enumerate(patterns):
+            _automaton.add_word(token, i)
+        _automaton.make_automaton()
+        return
+    
+    # Longest tokens first so each position reports the longest token starting there;
+    # the lookahead lets matches overlap, like the automaton's
+    ordered = sorted(patterns, key=len, reverse=True)
+    _combined = re.compile('(?=(' + '|'.join(re.escape(token) for token in ordered) + '))')
+    _token_ids = {token: i for i, token in enumerate(patterns)}
+    # Any shorter token found at the same position is a prefix of the longest one
+    _prefix_ids = [[j for j, other in enumerate(patterns) if token.startswith(other)]
+                   for token in patterns]
+
+def _iter_hits(text):
+    """Yield (end index, token index) for every token occurrence in text"""
+    if _automaton is not None:
+        yield from _automaton.iter(text)
+        return
+    for m in _combined.finditer(text):
+        start = m.start()
+        for j in _prefix_ids[_token_ids[m.group(1)]]:
+            yield start + len(_patterns[j]) - 1, j
+
+def _scan_one(path):
+    """Scan a single document in a worker process.
+    
+    Files whose raw XML cannot contain any token are skipped before
+    parsing. Otherwise all tokens are found in one pass over the text.
+    Returns (path, matched tokens, matched lines, token count); matched
+    lines are unique and capped at MAX_MATCHED_LINES.
+    """
+    xml = _read_document_xml(path)
+    if not _may_contain_tokens(xml, _pattern_bytes):
+        return path, [], [], 0
+    
+    full_text = _extract_text(xml)
+    counts = [0] * len(_patterns)
+    newlines = None
+    matched_lines = {}
+
+    for end_idx, i in _iter_hits(full_text):
+        counts[i] += 1
+        if len(matched_lines) >= MAX_MATCHED_LINES:
+            continue  # Keep counting tokens, but stop collecting lines
+        if newlines is None:
+            newlines = [m.start() for m in re.finditer('\n', full_text)]
+        line_no = bisect.bisect_left(newlines, end_idx)
+        start = newlines[line_no - 1] + 1 if line_no else 0
+        end = newlines[line_no] if line_no < len(newlines) else len(full_text)
+        matched_lines.setdefault(full_text[start:end].strip(), None)
+
+    matched = [token for token, count in zip(_patterns, counts) if count]
+    return path, matched, list(matched_lines), sum(counts)
+
+def _join_lines(lines):
+    """Join matched lines for a report cell, keeping the first MAX_REPORT_LINES"""
+    joined = '/----/'.join(lines[:MAX_REPORT_LINES])
+    extra = len(lines) - MAX_REPORT_LINES
+    if extra > 0:
+        joined += f'/----/…(+{extra} more)'
+    return joined
+
+@lru_cache(maxsize=4096)
+def _fmt_ts(ts):
+    """Format a file timestamp for the report; repeated timestamps hit the cache"""
+    return time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(ts))
+
+def _write_xlsx(path, rows):
+    """Write report rows (dicts sharing the same keys) to an .xlsx file.
+    
+    Streams one row at a time with xlsxwriter's constant_memory mode, so
+    only the current row is held in memory. Values starting with '=' are
+    written as formulas, which keeps the HYPERLINK column clickable; URLs
+    in other cells stay plain text so they do not count toward Excel's
+    per-sheet hyperlink limit.
+    """
+    workbook = xlsxwriter.Workbook(path, {'constant_memory': True, 'strings_to_urls': False})
+    try:
+        worksheet = workbook.add_worksheet()
+        header_format = workbook.add_format({'bold': True, 'border': 1, 'align': 'center'})
+        headers = list(rows[0])
+        worksheet.write_row(0, 0, headers, header_format)
+        for i, row in enumerate(rows, 1):
+            worksheet.write_row(i, 0, [row[h] for h in headers])
+    finally:
+        workbook.close()
+
+def _walk(folder, want_dcp=True, want_plain=True):
+    """Recursively yield (path, name, stat) for the selected .docx files.
+    
+    Uses os.scandir so names and stat results come from the directory
+    entries instead of separate basename/stat calls per file. Office lock
+    files (~$...) and non-.docx names are rejected before anything else.
+    """
+    stack = [folder]
+    while stack:
+        directory = stack.pop()
+        subdirs = []
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                        continue
+                    name = entry.name
+                    if name.startswith('~') or not name.endswith('.docx'):
+                        continue
+                    is_dcp = name.endswith('.dcp.docx')
+                    if (want_dcp if is_dcp else want_plain) and entry.is_file():
+                        try:
+                            info = entry.stat()
+                        except OSError:
+                            continue  # Vanished or unreadable; skip only this file
+                        yield entry.path, name, info
+        except OSError:
+            pass  # Still visit the subfolders listed before the error
+        # Reverse so subfolders are visited in listing order, like os.walk
+        stack.extend(reversed(subdirs))
+
 class DocXScanApp:
     """Modern DocXScan application"""
     
     def __init__(self):
         self.root = None
-        self.font_family = self.get_system_font()
         
         # State variables
         self.token_map = {}
+        self._label_to_keys = defaultdict(list)  # Reverse index of token_map
         self.config_file = "docxscan.ini"
         
         # UI variables - will be initialized after root window is created
@@ -474,15 +648,9 @@ class DocXScanApp:
         self.console = None
         self.token_dropdown = None
         
-    def get_system_font(self):
-        system = platform.system()
-        fonts = {
-            "Darwin": "SF Pro Display",
-            "Windows": "Segoe UI",
-            "Linux": "Ubuntu"
-        }
-        return fonts.get(system, "Arial")
-    
+        # UI updates posted by the scan thread, applied on the main thread by _pump
+        self.ui_q = queue.Queue()
+        
     def create_window(self):
         """Create the modern window"""
         if self.root:
@@ -494,7 +662,7 @@ class DocXScanApp:
         self.root = tk.Tk()
         self.root.title("DocXScan v3.0 - Professional Document Scanner")
         self.root.geometry("1300x800")
-        self.root.configure(bg=ModernColors.BG_PRIMARY)
+        self.root.configure(bg=BG_PRIMARY)
         self.root.resizable(True, True)
         self.root.minsize(1100, 700)
         
@@ -507,110 +675,111 @@ class DocXScanApp:
         self.create_interface()        
         self.load_config()
         self.center_window()
+        
+        # Start polling for UI updates from the scan thread
+        self.root.after(50, self._pump)
     
     def configure_dark_theme(self):
         """Configure dark theme for all ttk widgets"""
         style = ttk.Style()
         
-        # Force a dark theme
-        try:
-            style.theme_use('clam')  # Use clam as base for better customization
-        except:
-            pass
-        
         # Configure global options for better dark theme support
-        self.root.option_add('*TCombobox*Listbox.background', ModernColors.BG_SECONDARY)
-        self.root.option_add('*TCombobox*Listbox.foreground', ModernColors.TEXT_PRIMARY)
-        self.root.option_add('*TCombobox*Listbox.selectBackground', ModernColors.PRIMARY)
+        self.root.option_add('*TCombobox*Listbox.background', BG_SECONDARY)
+        self.root.option_add('*TCombobox*Listbox.foreground', TEXT_PRIMARY)
+        self.root.option_add('*TCombobox*Listbox.selectBackground', PRIMARY)
         self.root.option_add('*TCombobox*Listbox.selectForeground', 'white')
         self.root.option_add('*TCombobox*Listbox.borderWidth', '0')
         self.root.option_add('*TCombobox*Listbox.relief', 'flat')
         
-        # Configure ALL TCombobox styles aggressively
-        style.configure("TCombobox",
-                       fieldbackground=ModernColors.BG_SECONDARY,
-                       background=ModernColors.BG_SECONDARY,
-                       foreground=ModernColors.TEXT_PRIMARY,
-                       borderwidth=1,
-                       relief="flat",
-                       selectbackground=ModernColors.PRIMARY,
-                       selectforeground="white",
-                       arrowcolor=ModernColors.TEXT_PRIMARY,
-                       insertcolor=ModernColors.TEXT_PRIMARY,
-                       lightcolor=ModernColors.BG_SECONDARY,
-                       darkcolor=ModernColors.BG_SECONDARY,
-                       bordercolor=ModernColors.CARD_BORDER,
-                       focuscolor=ModernColors.PRIMARY)
-        
-        # Map ALL possible states for TCombobox
-        style.map("TCombobox",
-                 fieldbackground=[("readonly", ModernColors.BG_SECONDARY),
-                                ("active", ModernColors.BG_SECONDARY),
-                                ("focus", ModernColors.BG_SECONDARY),
-                                ("disabled", ModernColors.BG_SECONDARY),
-                                ("pressed", ModernColors.BG_SECONDARY),
-                                ("!readonly", ModernColors.BG_SECONDARY)],
-                 background=[("readonly", ModernColors.BG_SECONDARY),
-                           ("active", ModernColors.BG_SECONDARY),
-                           ("focus", ModernColors.BG_SECONDARY),
-                           ("disabled", ModernColors.BG_SECONDARY),
-                           ("pressed", ModernColors.BG_SECONDARY),
-                           ("!readonly", ModernColors.BG_SECONDARY)],
-                 foreground=[("readonly", ModernColors.TEXT_PRIMARY),
-                           ("active", ModernColors.TEXT_PRIMARY),
-                           ("focus", ModernColors.TEXT_PRIMARY),
-                           ("disabled", ModernColors.TEXT_MUTED),
-                           ("pressed", ModernColors.TEXT_PRIMARY),
-                           ("!readonly", ModernColors.TEXT_PRIMARY)],
-                 bordercolor=[("focus", ModernColors.PRIMARY),
-                            ("active", ModernColors.PRIMARY),
-                            ("readonly", ModernColors.CARD_BORDER),
-                            ("disabled", ModernColors.CARD_BORDER),
-                            ("pressed", ModernColors.PRIMARY),
-                            ("!readonly", ModernColors.CARD_BORDER)],
-                 arrowcolor=[("readonly", ModernColors.TEXT_PRIMARY),
-                           ("active", ModernColors.TEXT_PRIMARY),
-                           ("focus", ModernColors.TEXT_PRIMARY),
-                           ("disabled", ModernColors.TEXT_MUTED),
-                           ("pressed", ModernColors.TEXT_PRIMARY),
-                           ("!readonly", ModernColors.TEXT_PRIMARY)])
-        
-        # Configure scrollbar for dark theme
-        style.configure("Vertical.TScrollbar",
-                       background=ModernColors.CARD_BG,
-                       troughcolor=ModernColors.BG_SECONDARY,
-                       bordercolor=ModernColors.CARD_BORDER,
-                       arrowcolor=ModernColors.TEXT_PRIMARY,
-                       darkcolor=ModernColors.CARD_BG,
-                       lightcolor=ModernColors.CARD_BG)
-        
-        # Map scrollbar states
-        style.map("Vertical.TScrollbar",
-                 background=[("active", ModernColors.CARD_HOVER),
-                           ("pressed", ModernColors.PRIMARY)])
-        
-        # Configure progress bar theme with sunset colors
-        style.configure("Modern.Horizontal.TProgressbar",
-                       background=ModernColors.GRADIENT_3,  # Pink progress bar
-                       troughcolor=ModernColors.CARD_BG,
-                       borderwidth=0,
-                       lightcolor=ModernColors.GRADIENT_3,
-                       darkcolor=ModernColors.GRADIENT_3)
-        
-        # Also configure any other potential ttk widgets
-        style.configure("TEntry",
-                       fieldbackground=ModernColors.BG_SECONDARY,
-                       background=ModernColors.BG_SECONDARY,
-                       foreground=ModernColors.TEXT_PRIMARY,
-                       bordercolor=ModernColors.CARD_BORDER,
-                       insertcolor=ModernColors.TEXT_PRIMARY)
+        # Every state maps to the same dark field so readonly/focus never flash light
+        field_states = ["readonly", "active", "focus", "disabled", "pressed",
+                        "!readonly", "!focus", "!active"]
+        text_states = [("readonly", TEXT_PRIMARY),
+                       ("active", TEXT_PRIMARY),
+                       ("focus", TEXT_PRIMARY),
+                       ("disabled", TEXT_MUTED),
+                       ("pressed", TEXT_PRIMARY),
+                       ("!readonly", TEXT_PRIMARY)]
+        
+        # All widget styles in one settings table, applied by Tk in a single call
+        settings = {
+            "TCombobox": {
+                "configure": {
+                    "fieldbackground": BG_SECONDARY,
+                    "background": BG_SECONDARY,
+                    "foreground": TEXT_PRIMARY,
+                    "borderwidth": 1,
+                    "relief": "flat",
+                    "selectbackground": PRIMARY,
+                    "selectforeground": "white",
+                    "arrowcolor": TEXT_PRIMARY,
+                    "insertcolor": TEXT_PRIMARY,
+                    "lightcolor": BG_SECONDARY,
+                    "darkcolor": BG_SECONDARY,
+                    "bordercolor": CARD_BORDER,
+                    "focuscolor": PRIMARY
+                },
+                "map": {
+                    "fieldbackground": [(state, BG_SECONDARY) for state in field_states],
+                    "background": [(state, BG_SECONDARY) for state in field_states],
+                    "foreground": text_states,
+                    "bordercolor": [("focus", PRIMARY),
+                                    ("active", CARD_BORDER),
+                                    ("readonly", CARD_BORDER),
+                                    ("!focus", CARD_BORDER)],
+                    "arrowcolor": text_states
+                }
+            },
+            # Scrollbar for dark theme
+            "Vertical.TScrollbar": {
+                "configure": {
+                    "background": CARD_BG,
+                    "troughcolor": BG_SECONDARY,
+                    "bordercolor": CARD_BORDER,
+                    "arrowcolor": TEXT_PRIMARY,
+                    "darkcolor": CARD_BG,
+                    "lightcolor": CARD_BG
+                },
+                "map": {
+                    "background": [("active", CARD_HOVER),
+                                   ("pressed", PRIMARY)]
+                }
+            },
+            # Progress bar with sunset colors
+            "Modern.Horizontal.TProgressbar": {
+                "configure": {
+                    "background": GRADIENT_3,  # Pink progress bar
+                    "troughcolor": CARD_BG,
+                    "borderwidth": 0,
+                    "lightcolor": GRADIENT_3,
+                    "darkcolor": GRADIENT_3
+                }
+            },
+            # Also configure any other potential ttk widgets
+            "TEntry": {
+                "configure": {
+                    "fieldbackground": BG_SECONDARY,
+                    "background": BG_SECONDARY,
+                    "foreground": TEXT_PRIMARY,
+                    "bordercolor": CARD_BORDER,
+                    "insertcolor": TEXT_PRIMARY
+                },
+                "map": {
+                    "fieldbackground": [("focus", BG_SECONDARY),
+                                        ("active", BG_SECONDARY)],
+                    "bordercolor": [("focus", PRIMARY),
+                                    ("active", PRIMARY)]
+                }
+            }
+        }
         
-        style.map("TEntry",
-                 fieldbackground=[("focus", ModernColors.BG_SECONDARY),
-                                ("active", ModernColors.BG_SECONDARY)],
-                 bordercolor=[("focus", ModernColors.PRIMARY),
-                            ("active", ModernColors.PRIMARY)])
-
+        # Build on clam for better customization; each Tk root needs its own theme
+        try:
+            if "docxscan_dark" not in style.theme_names():
+                style.theme_create("docxscan_dark", parent="clam", settings=settings)
+            style.theme_use("docxscan_dark")
+        except tk.TclError:
+            pass
 
     def initialize_variables(self):
         """Initialize tkinter variables after root window exists"""
@@ -629,7 +798,7 @@ class DocXScanApp:
         bg_canvas.pack(fill=tk.BOTH, expand=True)
         
         # Main overlay
-        main_overlay = tk.Frame(bg_canvas, bg=ModernColors.BG_PRIMARY)
+        main_overlay = tk.Frame(bg_canvas, bg=BG_PRIMARY)
         main_overlay.place(relx=0, rely=0, relwidth=1, relheight=1)
         
         self.create_header(main_overlay)
@@ -638,34 +807,34 @@ class DocXScanApp:
     
     def create_header(self, parent):
         """Create header section"""
-        header_frame = tk.Frame(parent, bg=ModernColors.BG_PRIMARY, height=70)
+        header_frame = tk.Frame(parent, bg=BG_PRIMARY, height=70)
         header_frame.pack(fill=tk.X, padx=30, pady=(20, 10))
         header_frame.pack_propagate(False)
         
         # Title
         tk.Label(header_frame,
                 text="DocXScan v3.0",
-                font=(self.font_family, 24, "bold"),
-                bg=ModernColors.BG_PRIMARY,
-                fg=ModernColors.TEXT_PRIMARY).pack(anchor="w")
+                font=_font(24, "bold"),
+                bg=BG_PRIMARY,
+                fg=TEXT_PRIMARY).pack(anchor="w")
         
         tk.Label(header_frame,
                 text="Professional document scanner with intelligent token detection",
-                font=(self.font_family, 12, "normal"),
-                bg=ModernColors.BG_PRIMARY,
-                fg=ModernColors.TEXT_SECONDARY).pack(anchor="w", pady=(2, 0))
+                font=_font(12, "normal"),
+                bg=BG_PRIMARY,
+                fg=TEXT_SECONDARY).pack(anchor="w", pady=(2, 0))
     
     def create_main_content(self, parent):
         """Create main content area - compact layout"""
-        content_frame = tk.Frame(parent, bg=ModernColors.BG_PRIMARY)
+        content_frame = tk.Frame(parent, bg=BG_PRIMARY)
         content_frame.pack(fill=tk.BOTH, expand=True, padx=30, pady=(0, 10))
         
         # Left column - Configuration (60% width)
-        left_frame = tk.Frame(content_frame, bg=ModernColors.BG_PRIMARY)
+        left_frame = tk.Frame(content_frame, bg=BG_PRIMARY)
         left_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 15))
         
         # Right column - Results (40% width)
-        right_frame = tk.Frame(content_frame, bg=ModernColors.BG_PRIMARY)
+        right_frame = tk.Frame(content_frame, bg=BG_PRIMARY)
         right_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
         
         self.create_config_section(left_frame)
@@ -677,71 +846,71 @@ class DocXScanApp:
         file_card = ModernCard(parent, "📁  File Selection")
         file_card.pack(fill=tk.X, pady=(0, 8))
         
-        file_content = tk.Frame(file_card, bg=ModernColors.CARD_BG)
+        file_content = tk.Frame(file_card, bg=CARD_BG)
         file_content.pack(fill=tk.BOTH, expand=True, padx=12, pady=(0, 8))
         
         # Folder selection - more compact
-        folder_frame = tk.Frame(file_content, bg=ModernColors.CARD_BG)
+        folder_frame = tk.Frame(file_content, bg=CARD_BG)
         folder_frame.pack(fill=tk.X, pady=(0, 6))
         
         tk.Label(folder_frame, text="Scan Folder:",
-                font=(self.font_family, 10, "bold"),
-                bg=ModernColors.CARD_BG,
-                fg=ModernColors.TEXT_PRIMARY).pack(anchor="w", pady=(0, 2))
+                font=_font(10, "bold"),
+                bg=CARD_BG,
+                fg=TEXT_PRIMARY).pack(anchor="w", pady=(0, 2))
         
-        browse_frame = tk.Frame(folder_frame, bg=ModernColors.CARD_BG)
+        browse_frame = tk.Frame(folder_frame, bg=CARD_BG)
         browse_frame.pack(fill=tk.X)
         
         # Smaller button
         browse_btn = ModernButton(browse_frame, "Browse", self.browse_folder)
-        browse_btn.configure(padx=12, pady=6, font=(self.font_family, 9, "bold"))
+        browse_btn.configure(padx=12, pady=6, font=_font(9, "bold"))
         browse_btn.pack(side=tk.LEFT)
         
         self.folder_label = tk.Label(browse_frame, text="No folder selected",
-                                    font=(self.font_family, 8),
-                                    bg=ModernColors.CARD_BG,
-                                    fg=ModernColors.TEXT_TERTIARY,
+                                    font=_font(8),
+                                    bg=CARD_BG,
+                                    fg=TEXT_TERTIARY,
                                     width=30,  # Fixed width to prevent shaking
                                     anchor="w")  # Left align text
         self.folder_label.pack(side=tk.LEFT, padx=(8, 0))
         
         # ZIP Output settings - more compact
-        zip_folder_frame = tk.Frame(file_content, bg=ModernColors.CARD_BG)
+        zip_folder_frame = tk.Frame(file_content, bg=CARD_BG)
         zip_folder_frame.pack(fill=tk.X, pady=(0, 6))
         
         tk.Label(zip_folder_frame, text="Output Folder:",
-                font=(self.font_family, 10, "bold"),
-                bg=ModernColors.CARD_BG,
-                fg=ModernColors.TEXT_PRIMARY).pack(anchor="w", pady=(0, 2))
+                font=_font(10, "bold"),
+                bg=CARD_BG,
+                fg=TEXT_PRIMARY).pack(anchor="w", pady=(0, 2))
         
-        zip_browse_frame = tk.Frame(zip_folder_frame, bg=ModernColors.CARD_BG)
+        zip_browse_frame = tk.Frame(zip_folder_frame, bg=CARD_BG)
         zip_browse_frame.pack(fill=tk.X)
         
         zip_btn = ModernButton(zip_browse_frame, "Browse", self.browse_zip_folder, style="secondary")
-        zip_btn.configure(padx=12, pady=6, font=(self.font_family, 9, "bold"))
+        zip_btn.configure(padx=12, pady=6, font=_font(9, "bold"))
         zip_btn.pack(side=tk.LEFT)
         
         self.zip_folder_label = tk.Label(zip_browse_frame, text="No output folder selected",
-                                        font=(self.font_family, 8),
-                                        bg=ModernColors.CARD_BG,
-                                        fg=ModernColors.TEXT_TERTIARY,
+                                        font=_font(8),
+                                        bg=CARD_BG,
+                                        fg=TEXT_TERTIARY,
                                         width=30,  # Fixed width to prevent shaking
                                         anchor="w")  # Left align text
         self.zip_folder_label.pack(side=tk.LEFT, padx=(8, 0))
         
         # Compact inputs in two columns to save space
-        inputs_frame = tk.Frame(file_content, bg=ModernColors.CARD_BG)
+        inputs_frame = tk.Frame(file_content, bg=CARD_BG)
         inputs_frame.pack(fill=tk.X, pady=(0, 6))
         
         # Left column
-        left_inputs = tk.Frame(inputs_frame, bg=ModernColors.CARD_BG)
+        left_inputs = tk.Frame(inputs_frame, bg=CARD_BG)
         left_inputs.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 4))
         
         zip_name_entry = ModernEntry(left_inputs, "ZIP Name:", self.zip_name)
         zip_name_entry.pack(fill=tk.X)
         
         # Right column
-        right_inputs = tk.Frame(inputs_frame, bg=ModernColors.CARD_BG)
+        right_inputs = tk.Frame(inputs_frame, bg=CARD_BG)
         right_inputs.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(4, 0))
         
         file_type_combo = ModernCombobox(right_inputs, "File Type:", self.file_type_choice,
@@ -752,39 +921,39 @@ class DocXScanApp:
         token_card = ModernCard(parent, "🔍  Token Configuration")
         token_card.pack(fill=tk.X, pady=(0, 8))
         
-        token_content = tk.Frame(token_card, bg=ModernColors.CARD_BG)
+        token_content = tk.Frame(token_card, bg=CARD_BG)
         token_content.pack(fill=tk.BOTH, expand=True, padx=12, pady=(0, 8))
         
         # Token file loading - more compact
-        token_file_frame = tk.Frame(token_content, bg=ModernColors.CARD_BG)
+        token_file_frame = tk.Frame(token_content, bg=CARD_BG)
         token_file_frame.pack(fill=tk.X, pady=(0, 6))
         
         tk.Label(token_file_frame, text="Token File:",
-                font=(self.font_family, 10, "bold"),
-                bg=ModernColors.CARD_BG,
-                fg=ModernColors.TEXT_PRIMARY).pack(anchor="w", pady=(0, 2))
+                font=_font(10, "bold"),
+                bg=CARD_BG,
+                fg=TEXT_PRIMARY).pack(anchor="w", pady=(0, 2))
         
-        token_load_frame = tk.Frame(token_file_frame, bg=ModernColors.CARD_BG)
+        token_load_frame = tk.Frame(token_file_frame, bg=CARD_BG)
         token_load_frame.pack(fill=tk.X)
         
         token_btn = ModernButton(token_load_frame, "Load File", self.load_token_file)
-        token_btn.configure(padx=12, pady=6, font=(self.font_family, 9, "bold"))
+        token_btn.configure(padx=12, pady=6, font=_font(9, "bold"))
         token_btn.pack(side=tk.LEFT)
         
         self.token_file_label = tk.Label(token_load_frame, text="No token file loaded",
-                                        font=(self.font_family, 8),
-                                        bg=ModernColors.CARD_BG,
-                                        fg=ModernColors.TEXT_TERTIARY,
+                                        font=_font(8),
+                                        bg=CARD_BG,
+                                        fg=TEXT_TERTIARY,
                                         width=35,  # Fixed width to prevent shaking
                                         anchor="w")  # Left align text
         self.token_file_label.pack(side=tk.LEFT, padx=(8, 0))
         
         # Token selection and custom tokens in two columns
-        token_inputs_frame = tk.Frame(token_content, bg=ModernColors.CARD_BG)
+        token_inputs_frame = tk.Frame(token_content, bg=CARD_BG)
         token_inputs_frame.pack(fill=tk.X, pady=(0, 6))
         
         # Left column - Token selection
-        left_token = tk.Frame(token_inputs_frame, bg=ModernColors.CARD_BG)
+        left_token = tk.Frame(token_inputs_frame, bg=CARD_BG)
         left_token.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 4))
         
         self.token_dropdown = ModernCombobox(left_token, "Select Token:", self.selected_token_label,
@@ -792,7 +961,7 @@ class DocXScanApp:
         self.token_dropdown.pack(fill=tk.X)
         
         # Right column - Custom tokens
-        right_token = tk.Frame(token_inputs_frame, bg=ModernColors.CARD_BG)
+        right_token = tk.Frame(token_inputs_frame, bg=CARD_BG)
         right_token.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(4, 0))
         
         custom_tokens_entry = ModernEntry(right_token, "Custom Tokens:", self.custom_token_input)
@@ -802,7 +971,7 @@ class DocXScanApp:
         controls_card = ModernCard(parent, "⚡  Scan Controls")
         controls_card.pack(fill=tk.BOTH, expand=True)  # Changed to expand to fill remaining space
         
-        controls_content = tk.Frame(controls_card, bg=ModernColors.CARD_BG)
+        controls_content = tk.Frame(controls_card, bg=CARD_BG)
         controls_content.pack(fill=tk.BOTH, expand=True, padx=12, pady=(0, 8))
         
         # Progress bar - more compact
@@ -810,23 +979,23 @@ class DocXScanApp:
         self.progress_bar.pack(fill=tk.X, pady=(0, 6))
         
         # Control buttons - smaller and more compact
-        button_frame = tk.Frame(controls_content, bg=ModernColors.CARD_BG)
+        button_frame = tk.Frame(controls_content, bg=CARD_BG)
         button_frame.pack(fill=tk.X)
         
         start_btn = ModernButton(button_frame, "🚀 Start Scan", self.run_scan_threaded)
-        start_btn.configure(padx=14, pady=6, font=(self.font_family, 10, "bold"))
+        start_btn.configure(padx=14, pady=6, font=_font(10, "bold"))
         start_btn.pack(side=tk.LEFT, padx=(0, 6))
         
         template_btn = ModernButton(button_frame, "📄 Template", self.create_template, style="secondary")
-        template_btn.configure(padx=10, pady=6, font=(self.font_family, 9, "bold"))
+        template_btn.configure(padx=10, pady=6, font=_font(9, "bold"))
         template_btn.pack(side=tk.LEFT, padx=(0, 6))
         
         clear_btn = ModernButton(button_frame, "🧹 Clear", self.clear_console, style="secondary")
-        clear_btn.configure(padx=10, pady=6, font=(self.font_family, 9, "bold"))
+        clear_btn.configure(padx=10, pady=6, font=_font(9, "bold"))
         clear_btn.pack(side=tk.LEFT)
         
         # Add a spacer frame to push everything to the top and fill remaining space
-        spacer_frame = tk.Frame(controls_content, bg=ModernColors.CARD_BG)
+        spacer_frame = tk.Frame(controls_content, bg=CARD_BG)
         spacer_frame.pack(fill=tk.BOTH, expand=True)
     
     def create_results_section(self, parent):
@@ -835,23 +1004,23 @@ class DocXScanApp:
         console_card = ModernCard(parent, "📋  Scan Results")
         console_card.pack(fill=tk.BOTH, expand=True)
         
-        console_content = tk.Frame(console_card, bg=ModernColors.CARD_BG)
+        console_content = tk.Frame(console_card, bg=CARD_BG)
         console_content.pack(fill=tk.BOTH, expand=True, padx=12, pady=(0, 8))
         
         # Console area - optimized height
-        self.console = ModernTextArea(console_content, height=16)
+        self.console = ModernTextArea(console_content, height=16, max_lines=2000)
         self.console.pack(fill=tk.BOTH, expand=True)
     
     def create_footer(self, parent):
         """Create footer"""
-        footer_frame = tk.Frame(parent, bg=ModernColors.BG_PRIMARY)
+        footer_frame = tk.Frame(parent, bg=BG_PRIMARY)
         footer_frame.pack(side=tk.BOTTOM, fill=tk.X, padx=30, pady=(0, 15))
         
         tk.Label(footer_frame,
                 text="© 2025 Hrishik Kunduru • DocXScan v3.0 Professional • All Rights Reserved",
-                font=(self.font_family, 9, "normal"),
-                bg=ModernColors.BG_PRIMARY,
-                fg=ModernColors.TEXT_MUTED).pack()
+                font=_font(9, "normal"),
+                bg=BG_PRIMARY,
+                fg=TEXT_MUTED).pack()
     
     def center_window(self):
         """Center window on screen"""
@@ -866,10 +1035,35 @@ class DocXScanApp:
         """Log message to console"""
         timestamp = datetime.now().strftime("%H:%M:%S")
         formatted_msg = f"[{timestamp}] {message}\n"
-        self.console.insert(formatted_msg)
+        self.ui_q.put(('log', formatted_msg))
+    
+    def _apply_ui_updates(self):
+        """Apply queued UI updates: one console insert and only the latest progress"""
+        msgs = []
+        progress = None
+        try:
+            while len(msgs) < 500:
+                item = self.ui_q.get_nowait()
+                if item[0] == 'log':
+                    msgs.append(item[1])
+                elif item[0] == 'progress':
+                    progress = item[1:]
+        except queue.Empty:
+            pass
+        if msgs:
+            self.console.insert(''.join(msgs))
+        if progress is not None:
+            self.progress_bar.set_progress(*progress)
+    
+    def _pump(self):
+        """Poll the UI queue from the Tk main loop"""
+        self._apply_ui_updates()
+        self.root.after(50, self._pump)
     
     def clear_console(self):
         """Clear console"""
+        # Flush lines logged before the clear so they are cleared too
+        self._apply_ui_updates()
         self.console.clear()
         self.log("Console cleared")
     
@@ -899,6 +1093,12 @@ class DocXScanApp:
             self.save_config()
             self.log(f"✅ Selected output folder: {os.path.basename(path)}")
     
+    def _index_token_map(self):
+        """Rebuild the label -> tokens index after token_map changes"""
+        self._label_to_keys = defaultdict(list)
+        for k, v in self.token_map.items():
+            self._label_to_keys[v].append(k)
+    
     def load_token_file(self):
         """Load token file"""
         path = filedialog.askopenfilename(
@@ -909,6 +1109,7 @@ class DocXScanApp:
             try:
                 with open(path, "r", encoding='utf-8') as f:
                     self.token_map = json.load(f)
+                self._index_token_map()
                 
                 # Truncate long filenames to prevent UI shaking
                 filename = os.path.basename(path)
@@ -937,47 +1138,7 @@ class DocXScanApp:
     
     def create_template(self):
         """Create token template"""
-        template = {
-          "<<FileService.": "Fileservice",
-          "</ff>": "Page Break",
-          "</pp>": "Hard Return",
-          "<backspace>": "Backspace",
-          "<<STNDRDTH": "STNDRD Add \"TH\"",
-          "<c>": "Center",
-          "<u>": "Underline",
-          "<i>": "Italic",
-          "<pcase>": "pcase",
-          "<lcase>": "lcase",
-          "<ucase>": "ucase",
-          "<bold>": "Bold",
-          "<nobullet>": "No Bullet",
-          "<fontsize": "Font Size",
-          "<s1>": "s1",
-          "<s2>": "s2",
-          "[[MCOMPUTEINTO(<<": "MCOMPUTE INTO",
-          "[[SCOMPUTEINTO(": "SCOMPUTE INTO",
-          "[[ABORTIIF": "Abortif",
-          "PROMTINTO(": "PROMTINTO",
-          "PROMTINTOIIF(": "PROMTINTOIIF",
-          "PROMTINTOLIST(": "PROMTINTOLIST",
-          "PROMTINTOIIFLIST(": "PROMTINTOIIFLIST",
-          "PROMTFORM(": "PROMTFORM",
-          "<<Checklist.": "CHECKLIST",
-          "TABLE(": "TABLE",
-          "<<jfig": "JFIG",
-          "jfig": "JFIG_General",
-          "{ATTY": "ESIGN",
-          "<<Special.": "SPECIAL",
-          "+91|<<Special.ToDay": "+91 special day",
-          "-91|<<Special.ToDay": "-91 special day",
-          "+2|<<Special.ToDay": "+2 special day",
-          "-2|<<Special.ToDay": "-2 special day",
-          "<<Tracker.MortDate>>~MMMM dd": "MMMM dd,yyyy",
-          "<<Tracker.MortDate>>~MM-dd-yyyy": "MM-dd-yyyy",
-          "<<Tracker.MortDate>>~ddd": "ddd,MMM dd-yyyy",
-          "<<Tracker.OriginalPrincipal>>~##": "##,###,###.00",
-          "CU$TOMMMMMMPLACEHOLDER": "Custom(Enter Below)"
-        }
+        template = DEFAULT_TOKEN_TEMPLATE
         
         path = filedialog.asksaveasfilename(
             title="Save Token Template",
@@ -999,219 +1160,220 @@ class DocXScanApp:
         """Start scan in thread"""
         self.progress_bar.set_progress(0, "Starting scan...")
         self.log("🔍 Starting document scan...")
-        threading.Thread(target=self.scan_documents, daemon=True).start()
-    
-    def extract_full_text_lines(self, doc):
-        """Extract text from document"""
-        lines = []
-        for para in doc.paragraphs:
-            lines.append(para.text)
-        for table in doc.tables:
-            for row in table.rows:
-                for cell in row.cells:
-                    lines.append(cell.text)
-        return lines
+        
+        # Tk variables are read here on the main thread; the worker only sees a snapshot
+        settings = {
+            "folder": self.selected_folder.get().strip(),
+            "zip_dest": self.zip_folder.get().strip(),
+            "zip_filename_base": self.zip_name.get().strip(),
+            "selected_label": self.selected_token_label.get(),
+            "custom_tokens_text": self.custom_token_input.get(),
+            "file_type": self.file_type_choice.get()
+        }
+        threading.Thread(target=self.scan_documents, kwargs=settings, daemon=True).start()
     
-    def scan_documents(self):
-        """Main document scanning logic"""
+    def scan_documents(self, folder, zip_dest, zip_filename_base,
+                       selected_label, custom_tokens_text, file_type):
+        """Main document scanning logic, run on a worker thread.
+        
+        Never touches Tk directly: logs and progress go through self.ui_q.
+        """
         try:
             # Reset progress
-            self.root.after(0, lambda: self.progress_bar.set_progress(0, "Initializing..."))
-            
-            folder = self.selected_folder.get().strip()
-            zip_dest = self.zip_folder.get().strip()
-            zip_filename_base = self.zip_name.get().strip()
+            self.ui_q.put(('progress', 0, "Initializing..."))
 
             # Validation - 5% progress
-            self.root.after(0, lambda: self.progress_bar.set_progress(5, "Validating inputs..."))
+            self.ui_q.put(('progress', 5, "Validating inputs..."))
             
             if not folder or not os.path.isdir(folder):
-                self.root.after(0, lambda: self.log("❌ Invalid folder selected"))
-                self.root.after(0, lambda: self.progress_bar.set_progress(0, "Invalid folder"))
+                self.log("❌ Invalid folder selected")
+                self.ui_q.put(('progress', 0, "Invalid folder"))
                 return
 
             if not zip_dest or not os.path.isdir(zip_dest):
-                self.root.after(0, lambda: self.log("❌ Invalid ZIP destination folder"))
-                self.root.after(0, lambda: self.progress_bar.set_progress(0, "Invalid ZIP folder"))
+                self.log("❌ Invalid ZIP destination folder")
+                self.ui_q.put(('progress', 0, "Invalid ZIP folder"))
                 return
 
             if not zip_filename_base:
-                self.root.after(0, lambda: self.log("❌ ZIP filename cannot be empty"))
-                self.root.after(0, lambda: self.progress_bar.set_progress(0, "Invalid ZIP name"))
+                self.log("❌ ZIP filename cannot be empty")
+                self.ui_q.put(('progress', 0, "Invalid ZIP name"))
                 return
 
             if not self.token_map:
-                self.root.after(0, lambda: self.log("❌ No tokens loaded. Please load a token file first."))
-                self.root.after(0, lambda: self.progress_bar.set_progress(0, "No tokens loaded"))
+                self.log("❌ No tokens loaded. Please load a token file first.")
+                self.ui_q.put(('progress', 0, "No tokens loaded"))
                 return
 
             # Get selected token - 10% progress
-            self.root.after(0, lambda: self.progress_bar.set_progress(10, "Processing tokens..."))
+            self.ui_q.put(('progress', 10, "Processing tokens..."))
             
-            selected_label = self.selected_token_label.get()
-            matched_tokens = [k for k, v in self.token_map.items() if v == selected_label]
+            matched_tokens = list(self._label_to_keys.get(selected_label, ()))
             if not matched_tokens and selected_label != "-- Select Token --":
                 patterns = matched_tokens
             else:
                 # If no specific token selected, ask user
                 if selected_label == "-- Select Token --":
-                    self.root.after(0, lambda: self.log("❌ Please select a valid token from the dropdown"))
-                    self.root.after(0, lambda: self.progress_bar.set_progress(0, "No token selected"))
+                    self.log("❌ Please select a valid token from the dropdown")
+                    self.ui_q.put(('progress', 0, "No token selected"))
                     return
                 patterns = matched_tokens
 
             # Add custom tokens
-            custom_tokens = [t.strip() for t in self.custom_token_input.get().split(",") if t.strip()]
-            for ct in custom_tokens:
-                self.token_map[ct] = f"Custom: {ct}"
+            custom_tokens = [t.strip() for t in custom_tokens_text.split(",") if t.strip()]
+            # Labels for this scan only, so custom tokens don't leak into token_map
+            labels = dict(self.token_map)
+            labels.update({ct: f"Custom: {ct}" for ct in custom_tokens})
             patterns += custom_tokens
+            patterns = list(dict.fromkeys(patterns))  # Drop duplicate tokens, keep order
 
             if not patterns:
-                self.root.after(0, lambda: self.log("❌ No patterns to search for. Please select a token or add custom tokens."))
-                self.root.after(0, lambda: self.progress_bar.set_progress(0, "No patterns"))
+                self.log("❌ No patterns to search for. Please select a token or add custom tokens.")
+                self.ui_q.put(('progress', 0, "No patterns"))
                 return
 
             # File type filter - 15% progress
-            self.root.after(0, lambda: self.progress_bar.set_progress(15, "Setting up file filters..."))
+            self.ui_q.put(('progress', 15, "Setting up file filters..."))
             
-            file_type_map = {
-                "Only .dcp.docx": lambda f: f.endswith('.dcp.docx'),
-                "Only .docx (excluding .dcp.docx)": lambda f: f.endswith('.docx') and not f.endswith('.dcp.docx'),
-                "Both (.docx and .dcp.docx)": lambda f: f.endswith('.docx')
-            }
-            file_filter = file_type_map.get(self.file_type_choice.get())
+            want_dcp = file_type != "Only .docx (excluding .dcp.docx)"
+            want_plain = file_type != "Only .dcp.docx"
 
             matching_files = []
             metadata = []
 
             # Scan files - 20% progress
-            self.root.after(0, lambda: self.progress_bar.set_progress(20, "Collecting files..."))
-            self.root.after(0, lambda: self.log(f"🔍 Scanning folder: {folder}"))
-            self.root.after(0, lambda: self.log(f"📋 Looking for patterns: {', '.join(patterns[:3])}{'...' if len(patterns) > 3 else ''}"))
+            self.ui_q.put(('progress', 20, "Collecting files..."))
+            self.log(f"🔍 Scanning folder: {folder}")
+            self.log(f"📋 Looking for patterns: {', '.join(patterns[:3])}{'...' if len(patterns) > 3 else ''}")
             
-            all_files = []
-            for root_dir, _, files in os.walk(folder):
-                for file in files:
-                    if file_filter(file) and not file.startswith('~'):
-                        all_files.append(os.path.join(root_dir, file))
+            all_files = list(_walk(folder, want_dcp, want_plain))
 
             if not all_files:
-                self.root.after(0, lambda: self.log("❌ No files found to scan"))
-                self.root.after(0, lambda: self.progress_bar.set_progress(0, "No files found"))
+                self.log("❌ No files found to scan")
+                self.ui_q.put(('progress', 0, "No files found"))
                 return
 
-            self.root.after(0, lambda: self.log(f"📄 Found {len(all_files)} files to scan"))
-            self.root.after(0, lambda: self.progress_bar.set_progress(25, f"Found {len(all_files)} files"))
+            self.log(f"📄 Found {len(all_files)} files to scan")
+            self.ui_q.put(('progress', 25, f"Found {len(all_files)} files"))
 
             # Process files - 25% to 80% progress
             scan_progress_start = 25
             scan_progress_range = 55  # 80% - 25% = 55%
             
-            for i, full_path in enumerate(all_files):
-                try:
-                    # Calculate accurate progress for file scanning
-                    file_progress = scan_progress_start + int((i / len(all_files)) * scan_progress_range)
-                    progress_text = f"Scanning file {i + 1}/{len(all_files)}: {os.path.basename(full_path)[:30]}{'...' if len(os.path.basename(full_path)) > 30 else ''}"
-                    
-                    self.root.after(0, lambda p=file_progress, t=progress_text: 
-                                   self.progress_bar.set_progress(p, t))
+            # Documents are parsed in parallel; results are kept in file order
+            results = [None] * len(all_files)
+            # Windows rejects more than 61 worker processes
+            max_workers = min(os.cpu_count() or 1, 61)
+            with ProcessPoolExecutor(max_workers=max_workers,
+                                     initializer=_init_worker,
+                                     initargs=(patterns,)) as executor:
+                # Keep a sliding window of files in flight: every worker stays busy, so one
+                # file's read overlaps another's matching, without queuing the whole tree
+                window = max_workers * 2
+                in_flight = {}
+                next_index = 0
+                completed = 0
+                
+                while in_flight or next_index < len(all_files):
+                    while next_index < len(all_files) and len(in_flight) < window:
+                        in_flight[executor.submit(_scan_one, all_files[next_index][0])] = next_index
+                        next_index += 1
                     
-                    doc = Document(full_path)
-                    full_text = '\n'.join(self.extract_full_text_lines(doc))
-                    matched = []
-                    matched_lines = []
-
-                    for token in patterns:
-                        if token in full_text:
-                            matched.append(token)
-                            matched_lines.extend([line.strip() for line in full_text.split('\n') if token in line])
-
-                    if matched:
-                        matching_files.append(full_path)
-                        info = os.stat(full_path)
-                        token_count = sum(full_text.count(token) for token in matched)
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        index = in_flight.pop(future)
+                        name = all_files[index][1]
+                        completed += 1
                         
-                        # Get token labels for matched tokens
-                        token_labels = []
-                        for token in matched:
-                            if token in self.token_map:
-                                token_labels.append(self.token_map[token])
-                            else:
-                                token_labels.append(token)
+                        # Calculate accurate progress for file scanning
+                        file_progress = scan_progress_start + int((completed / len(all_files)) * scan_progress_range)
+                        progress_text = f"Scanning file {completed}/{len(all_files)}: {name[:30]}{'...' if len(name) > 30 else ''}"
                         
-                        metadata.append({
-                            'File Name': os.path.basename(full_path),
-                            'File Path': full_path,
-                            'Size (bytes)': info.st_size,
-                            'Creation Date': datetime.fromtimestamp(info.st_ctime).strftime('%Y-%m-%d %H:%M:%S'),
-                            'Modified Date': datetime.fromtimestamp(info.st_mtime).strftime('%Y-%m-%d %H:%M:%S'),
-                            'Matched Pattern(s)': ', '.join(token_labels),
-                            'Matched Line(s)': '/----/'.join(matched_lines),
-                            'Token Match Count': token_count,
-                            'Link to File': f'=HYPERLINK("{full_path}", "Open File")'
-                        })
+                        self.ui_q.put(('progress', file_progress, progress_text))
                         
-                        self.root.after(0, lambda fname=os.path.basename(full_path): 
-                                       self.log(f"✅ Found match in: {fname}"))
-
-                except Exception as e:
-                    self.root.after(0, lambda path=full_path, error=str(e): 
-                                   self.log(f"❌ Error processing {os.path.basename(path)}: {error}"))
+                        try:
+                            results[index] = future.result()
+                        except Exception as e:
+                            self.log(f"❌ Error processing {name}: {e}")
+                            continue
+                        
+                        if results[index][1]:
+                            self.log(f"✅ Found match in: {name}")
+            
+            for (full_path, name, info), result in zip(all_files, results):
+                if result is None or not result[1]:
+                    continue
+                _, matched, matched_lines, token_count = result
+                matching_files.append(full_path)
+                
+                # Get token labels for matched tokens
+                token_labels = [labels.get(token, token) for token in matched]
+                
+                metadata.append({
+                    'File Name': name,
+                    'File Path': full_path,
+                    'Size (bytes)': info.st_size,
+                    'Creation Date': _fmt_ts(info.st_ctime),
+                    'Modified Date': _fmt_ts(info.st_mtime),
+                    'Matched Pattern(s)': ', '.join(token_labels),
+                    'Matched Line(s)': _join_lines(matched_lines),
+                    'Token Match Count': token_count,
+                    'Link to File': f'=HYPERLINK("{full_path}", "Open File")'
+                })
 
             # Complete file scanning - 80% progress
-            self.root.after(0, lambda: self.progress_bar.set_progress(80, "File scanning complete"))
+            self.ui_q.put(('progress', 80, "File scanning complete"))
 
             if not matching_files:
-                self.root.after(0, lambda: self.log("ℹ️ No matching files found"))
-                self.root.after(0, lambda: self.progress_bar.set_progress(100, "No matches found"))
+                self.log("ℹ️ No matching files found")
+                self.ui_q.put(('progress', 100, "No matches found"))
                 return
 
             # Create Excel file - 85% progress
-            self.root.after(0, lambda: self.progress_bar.set_progress(85, "Creating Excel report..."))
-            self.root.after(0, lambda: self.log("📊 Creating Excel report..."))
-            excel_filename = os.path.join(folder, 'matching_files_metadata.xlsx')
-            pd.DataFrame(metadata).to_excel(excel_filename, index=False)
-
-            # Create ZIP archive - 90% progress
-            self.root.after(0, lambda: self.progress_bar.set_progress(90, "Creating ZIP archive..."))
-            self.root.after(0, lambda: self.log("🗜️ Creating ZIP archive..."))
-            zip_path = os.path.join(zip_dest, zip_filename_base + '.zip')
-            matched_folder = tempfile.mkdtemp(prefix='Matched_Files_')
+            self.ui_q.put(('progress', 85, "Creating Excel report..."))
+            self.log("📊 Creating Excel report...")
+            # The report is staged in a temp file so the scanned folder is never written to
+            excel_fd, excel_filename = tempfile.mkstemp(suffix='.xlsx', prefix='docxscan_')
+            os.close(excel_fd)
 
             try:
-                # Copy matching files - 95% progress
-                self.root.after(0, lambda: self.progress_bar.set_progress(95, "Copying files to archive..."))
-                for file in matching_files:
-                    dest = os.path.join(matched_folder, os.path.basename(file))
-                    shutil.copy2(file, dest)
-
-                # Create ZIP - 98% progress
-                self.root.after(0, lambda: self.progress_bar.set_progress(98, "Finalizing ZIP archive..."))
-                with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+                _write_xlsx(excel_filename, metadata)
+
+                # Create ZIP archive - 90% progress
+                self.ui_q.put(('progress', 90, "Creating ZIP archive..."))
+                self.log("🗜️ Creating ZIP archive...")
+                zip_path = os.path.join(zip_dest, zip_filename_base + '.zip')
+
+                # Files sharing a name keep the last one, as the flat archive folder always has
+                archive_entries = {row['File Name']: row['File Path'] for row in metadata}
+
+                # Write matching files straight into the ZIP - 95% progress
+                self.ui_q.put(('progress', 95, "Writing files to archive..."))
+                # .docx files are already deflated, so store them as-is; only the report is compressed
+                with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zipf:
                     zipf.write(excel_filename, arcname='matching_files_metadata.xlsx')
-                    for file in os.listdir(matched_folder):
-                        zipf.write(os.path.join(matched_folder, file), 
-                                 arcname=os.path.join('Matched_Files', file))
+                    for name, file in archive_entries.items():
+                        zipf.write(file, arcname=f'Matched_Files/{name}',
+                                   compress_type=zipfile.ZIP_STORED)
 
                 # Complete - 100% progress
-                self.root.after(0, lambda: self.progress_bar.set_progress(100, "Scan complete!"))
-                self.root.after(0, lambda: self.log(f"✅ Scan complete! {len(matching_files)} matching files found"))
-                self.root.after(0, lambda: self.log(f"📄 Excel report: {excel_filename}"))
-                self.root.after(0, lambda: self.log(f"🗜️ ZIP archive: {zip_path}"))
+                self.ui_q.put(('progress', 100, "Scan complete!"))
+                self.log(f"✅ Scan complete! {len(matching_files)} matching files found")
+                self.log("📄 Excel report: matching_files_metadata.xlsx (inside the ZIP)")
+                self.log(f"🗜️ ZIP archive: {zip_path}")
 
             except Exception as e:
-                self.root.after(0, lambda error=str(e): self.log(f"❌ Error creating output files: {error}"))
-                self.root.after(0, lambda: self.progress_bar.set_progress(0, "Error creating files"))
+                self.log(f"❌ Error creating output files: {e}")
+                self.ui_q.put(('progress', 0, "Error creating files"))
             finally:
-                # Cleanup temp folder
                 try:
-                    shutil.rmtree(matched_folder)
-                except:
+                    os.remove(excel_filename)
+                except OSError:
                     pass
 
         except Exception as e:
-            self.root.after(0, lambda error=str(e): self.log(f"❌ Scan failed: {error}"))
-            self.root.after(0, lambda: self.progress_bar.set_progress(0, "Scan failed"))
+            self.log(f"❌ Scan failed: {e}")
+            self.ui_q.put(('progress', 0, "Scan failed"))
     
     def load_config(self):
         """Load configuration"""
@@ -1242,6 +1404,7 @@ class DocXScanApp:
                     try:
                         with open(token_file, "r", encoding='utf-8') as f:
                             self.token_map = json.load(f)
+                        self._index_token_map()
                         
                         # Truncate filename for display
                         filename = os.path.basename(token_file)
@@ -1294,6 +1457,7 @@ def main():
     app.run()
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     main()
 
 
@@ -4,84 +4,118 @@ Copyright 2025 Hrishik Kunduru. All rights reserved.
 """
 
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
+from tkinter import ttk
+import tkinter.font as tkfont
 import platform
-import ctypes
-import subprocess
-from datetime import datetime
 import json
+import atexit
 import os
-import sys
-from pathlib import Path
+import time
+import traceback
+from functools import lru_cache
+from typing import Final
 
 
 # DPI
 if platform.system() == "Windows":
     try:
+        import ctypes
         ctypes.windll.shcore.SetProcessDpiAwareness(2)
         ctypes.windll.user32.ShowWindow(ctypes.windll.kernel32.GetConsoleWindow(), 0)
     except:
         pass
 
-class ModernColors:
-    """Premium dark theme color palette"""
-    BG_PRIMARY = "#0A0E1A"
-    BG_SECONDARY = "#0F1419"
-    
-    GLASS_BG = "#1A1D29"  # Changed from gray to dark blue-purple
-    GLASS_BORDER = "#2A2D3A"  # Matching border
-    GLASS_HOVER = "#1F2235"  # Hover state
-    
-    CARD_BG = "#161925"  # Dark blue instead of gray
-    CARD_BORDER = "#252837"  # Subtle blue border
-    CARD_HOVER = "#1C1F2E"  # Blue hover
-    
-    PRIMARY = "#2563EB"
-    PRIMARY_HOVER = "#1D4ED8"
-    SUCCESS = "#10B981"
-    WARNING = "#F59E0B"
-    ERROR = "#EF4444"
-    
-    TEXT_PRIMARY = "#FFFFFF"
-    TEXT_SECONDARY = "#E5E7EB"
-    TEXT_TERTIARY = "#9CA3AF"
-    TEXT_MUTED = "#6B7280"
-    
-    FOCUS_RING = "#2563EB"
+# Premium dark theme color palette
+BG_PRIMARY: Final = "#0A0E1A"
+BG_SECONDARY: Final = "#0F1419"
+
+GLASS_BG: Final = "#1A1D29"  # Changed from gray to dark blue-purple
+GLASS_BORDER: Final = "#2A2D3A"  # Matching border
+GLASS_HOVER: Final = "#1F2235"  # Hover state
+
+CARD_BG: Final = "#161925"  # Dark blue instead of gray
+CARD_BORDER: Final = "#252837"  # Subtle blue border
+CARD_HOVER: Final = "#1C1F2E"  # Blue hover
+
+PRIMARY: Final = "#2563EB"
+PRIMARY_HOVER: Final = "#1D4ED8"
+SUCCESS: Final = "#10B981"
+WARNING: Final = "#F59E0B"
+ERROR: Final = "#EF4444"
+
+TEXT_PRIMARY: Final = "#FFFFFF"
+TEXT_SECONDARY: Final = "#E5E7EB"
+TEXT_TERTIARY: Final = "#9CA3AF"
+TEXT_MUTED: Final = "#6B7280"
+
+FOCUS_RING: Final = "#2563EB"
+
+@lru_cache(maxsize=None)
+def _system_font():
+    """Platform UI font family, resolved once per process"""
+    fonts = {
+        "Darwin": "SF Pro Display",
+        "Windows": "Segoe UI",
+        "Linux": "Ubuntu"
+    }
+    return fonts.get(platform.system(), "Arial")
+
+@lru_cache(maxsize=None)
+def _font(size, weight="normal"):
+    """Named Tk font shared by every widget using this size and weight"""
+    return tkfont.Font(family=_system_font(), size=size, weight=weight)
+
+def _format_last_used(last_used):
+    """Format an ISO last used timestamp for the stats panel"""
+    if last_used == "Never":
+        return "Never"
+    from datetime import datetime
+    try:
+        date_obj = datetime.fromisoformat(last_used)
+        return date_obj.strftime("%b %d")
+    except:
+        return "Never"
+
+@lru_cache(maxsize=None)
+def _gradient_rows(height):
+    """PhotoImage data for a one-pixel-wide vertical gradient of the given height"""
+    rows = []
+    for i in range(height):
+        ratio = i / height
+        color_val = int(10 + (25 - 10) * (1 - ratio))
+        rows.append(f"{{#{color_val:02x}{color_val + 2:02x}{color_val + 8:02x}}}")
+    return " ".join(rows)
 
 class BlurredBackground(tk.Canvas):
     
     def __init__(self, parent, width, height):
         super().__init__(parent, width=width, height=height, highlightthickness=0, bd=0)
-        self.configure(bg=ModernColors.BG_PRIMARY)
+        self.configure(bg=BG_PRIMARY)
         self.width = width
         self.height = height
         self.create_gradient_background()
     
     def create_gradient_background(self):
-        """Create gradient background"""
-        for i in range(self.height):
-            ratio = i / self.height
-            color_val = int(10 + (25 - 10) * (1 - ratio))
-            color = f"#{color_val:02x}{color_val + 2:02x}{color_val + 8:02x}"
-            self.create_line(0, i, self.width, i, fill=color, width=1)
-        
-        # Add decorative circles
-        self.create_blur_circle(150, 100, 60)
-        self.create_blur_circle(self.width - 120, 200, 40)
-        self.create_blur_circle(300, self.height - 150, 80)
-
-    def create_blur_circle(self, x, y, radius):
-        """Create decorative circle"""
-        colors = [ModernColors.PRIMARY, ModernColors.SUCCESS]
-        for i, color in enumerate(colors[:2]):
-            r = radius - i * 15
-            if r > 0:
-                self.create_oval(x - r, y - r, x + r, y + r,
-                               fill=color, outline="", stipple="gray12")
+        """Create gradient background as a single image item"""
+        # One pixel per row, tiled across the width by Tk in a single put
+        self._bg_img = tk.PhotoImage(master=self, width=self.width, height=self.height)
+        self._bg_img.put(_gradient_rows(self.height), to=(0, 0, self.width, self.height))
+        self.create_image(0, 0, anchor="nw", image=self._bg_img)
 
 class GlassMorphCard(tk.Frame):
 
+    # Text label specs shared by every card: (attribute, text attribute,
+    # font size/weight, label options, pack options)
+    _LABEL_SPECS = (
+        ("title_label", "title", (22, "bold"),
+         {"bg": CARD_BG, "fg": TEXT_PRIMARY, "anchor": "w"},
+         {"fill": tk.X, "pady": (0, 6)}),
+        ("subtitle_label", "subtitle", (12, "normal"),
+         {"bg": CARD_BG, "fg": TEXT_SECONDARY, "wraplength": 360,
+          "justify": "left", "anchor": "w"},
+         {"fill": tk.X, "pady": (0, 20)}),
+    )
+
     def __init__(self, parent, title, subtitle, icon, primary_color, command, shortcut=""):
         super().__init__(parent)
         
@@ -91,53 +125,51 @@ class GlassMorphCard(tk.Frame):
         self.primary_color = primary_color
         self.command = command
         self.shortcut = shortcut
-        self.font_family = self.get_system_font()
         
         self.setup_card()
         self.create_content()
         self.setup_interactions()
     
-    def get_system_font(self):
-        system = platform.system()
-        fonts = {
-            "Darwin": "SF Pro Display",
-            "Windows": "Segoe UI",
-            "Linux": "Ubuntu"
-        }
-        return fonts.get(system, "Arial")
+    # Program availability, shared by all cards and refreshed every few seconds
+    _avail_cache = None
+    _avail_time = 0.0
     
-    def check_programs_available(self):
+    @classmethod
+    def check_programs_available(cls):
         """Check if both programs are available"""
-        scan_exists = os.path.exists("docxscan2_0.py")
-        replace_exists = os.path.exists("docxreplace2_0.py")
-        return scan_exists and replace_exists
+        now = time.monotonic()
+        if cls._avail_cache is None or now - cls._avail_time >= 2.0:
+            cls._avail_cache = (os.path.exists("docxscan2_0.py")
+                                and os.path.exists("docxreplace2_0.py"))
+            cls._avail_time = now
+        return cls._avail_cache
     
     def get_status_color_and_text(self):
         """Get status based on program availability"""
         if self.check_programs_available():
-            return ModernColors.SUCCESS, "All systems operational"
+            return SUCCESS, "All systems operational"
         else:
-            return ModernColors.WARNING, "Some programs not detected"
+            return WARNING, "Some programs not detected"
     
     def setup_card(self):
         """Setup card styling"""
         self.configure(
-            bg=ModernColors.CARD_BG,
+            bg=CARD_BG,
             relief="flat",
             bd=0,
             highlightthickness=1,
-            highlightbackground=ModernColors.CARD_BORDER
+            highlightbackground=CARD_BORDER
         )
         self.configure(width=420, height=300)
         self.pack_propagate(False)
     
     def create_content(self):
         """Create card content"""
-        container = tk.Frame(self, bg=ModernColors.CARD_BG)
+        container = tk.Frame(self, bg=CARD_BG)
         container.pack(fill=tk.BOTH, expand=True, padx=28, pady=24)
         
         # Header with icon - reduced top padding
-        header_frame = tk.Frame(container, bg=ModernColors.CARD_BG)
+        header_frame = tk.Frame(container, bg=CARD_BG)
         header_frame.pack(fill=tk.X, pady=(0, 16))
         
         # Icon
@@ -146,208 +178,211 @@ class GlassMorphCard(tk.Frame):
         icon_container.pack(side=tk.LEFT)
         
         icon_label = tk.Label(icon_container, text=self.icon,
-                             font=(self.font_family, 26, "normal"),
+                             font=_font(26, "normal"),
                              bg=self.primary_color, fg="white")
         icon_label.pack(expand=True)
         
         # Status dot
         status_dot = tk.Label(header_frame, text="●",
                              font=("Arial", 8),
-                             fg=ModernColors.SUCCESS,
-                             bg=ModernColors.CARD_BG)
+                             fg=SUCCESS,
+                             bg=CARD_BG)
         status_dot.pack(side=tk.RIGHT)
         
-        # Title
-        title_label = tk.Label(container, text=self.title,
-                              font=(self.font_family, 22, "bold"),
-                              bg=ModernColors.CARD_BG,
-                              fg=ModernColors.TEXT_PRIMARY,
-                              anchor="w")
-        title_label.pack(fill=tk.X, pady=(0, 6))
-        
-        # Subtitle
-        subtitle_label = tk.Label(container, text=self.subtitle,
-                                 font=(self.font_family, 12, "normal"),
-                                 bg=ModernColors.CARD_BG,
-                                 fg=ModernColors.TEXT_SECONDARY,
-                                 wraplength=360,
-                                 justify="left",
-                                 anchor="w")
-        subtitle_label.pack(fill=tk.X, pady=(0, 20))
+        # Title and subtitle
+        for name, text_attr, (size, weight), options, pack_options in self._LABEL_SPECS:
+            label = tk.Label(container, text=getattr(self, text_attr),
+                             font=_font(size, weight), **options)
+            label.pack(**pack_options)
+            setattr(self, name, label)
         
         # Action section
-        action_frame = tk.Frame(container, bg=ModernColors.CARD_BG)
+        action_frame = tk.Frame(container, bg=CARD_BG)
         action_frame.pack(fill=tk.X, side=tk.BOTTOM)
         
-        # launch button
-        self.action_btn = tk.Button(action_frame,
-                                   text=f"Launch {self.title}",
-                                   font=(self.font_family, 13, "bold"),
-                                   bg=self.primary_color,
-                                   fg="white",
-                                   activebackground=self.primary_color,
-                                   activeforeground="white",
-                                   bd=0,
-                                   relief="flat",
-                                   padx=40,
-                                   pady=18,
-                                   cursor="hand2",
-                                   command=self.command)
+        # launch button - hover color comes from the style map, not Python callbacks
+        button_style = f"{self.title}.Card.TButton"
+        style = ttk.Style(self)
+        style.configure(button_style,
+                        font=_font(13, "bold"),
+                        background=self.primary_color,
+                        foreground="white",
+                        bordercolor=self.primary_color,
+                        lightcolor=self.primary_color,
+                        darkcolor=self.primary_color,
+                        focuscolor=self.primary_color,
+                        borderwidth=0,
+                        relief="flat",
+                        padding=(40, 18))
+        style.map(button_style,
+                  background=[("active", PRIMARY_HOVER)],
+                  lightcolor=[("active", PRIMARY_HOVER)],
+                  darkcolor=[("active", PRIMARY_HOVER)],
+                  foreground=[("active", "white")])
+        
+        self.action_btn = ttk.Button(action_frame,
+                                     text=f"Launch {self.title}",
+                                     style=button_style,
+                                     cursor="hand2",
+                                     command=self.command)
         self.action_btn.pack(side=tk.LEFT)
         
         # Shortcut badge with improved styling
         if self.shortcut:
-            shortcut_frame = tk.Frame(action_frame, bg=ModernColors.GLASS_BG,
+            shortcut_frame = tk.Frame(action_frame, bg=GLASS_BG,
                                      highlightthickness=1,
-                                     highlightbackground=ModernColors.GLASS_BORDER)
+                                     highlightbackground=GLASS_BORDER)
             shortcut_frame.pack(side=tk.RIGHT, padx=(16, 0))
             
             shortcut_label = tk.Label(shortcut_frame, text=self.shortcut,
-                                     font=(self.font_family, 11, "bold"),
-                                     bg=ModernColors.GLASS_BG,
-                                     fg=ModernColors.TEXT_TERTIARY,
+                                     font=_font(11, "bold"),
+                                     bg=GLASS_BG,
+                                     fg=TEXT_TERTIARY,
                                      padx=12, pady=8)
             shortcut_label.pack()
-        
-        # Store widgets for hover effects
-        self.hover_widgets = [self, container, header_frame, title_label, subtitle_label]
     
     def setup_interactions(self):
-        """Setup hover interactions - only for card areas, not button"""
-        for widget in self.hover_widgets:
-            widget.bind("<Enter>", self.on_enter)
-            widget.bind("<Leave>", self.on_leave)
-        
-        self.action_btn.bind("<Enter>", self.on_button_enter)
-        self.action_btn.bind("<Leave>", self.on_button_leave)
+        """Setup hover interactions on the card frame itself"""
+        self.bind("<Enter>", self.on_enter)
+        self.bind("<Leave>", self.on_leave)
     
     def on_enter(self, event):
         """Hover effect - no background highlighting"""
-        self.configure(highlightbackground=ModernColors.FOCUS_RING)
+        self.configure(highlightbackground=FOCUS_RING)
     
     def on_leave(self, event):
-        """Reset hover"""
-        self.configure(highlightbackground=ModernColors.CARD_BORDER)
-    
-    def on_button_enter(self, event):
-        """Button hover"""
-        self.action_btn.configure(bg=ModernColors.PRIMARY_HOVER)
-    
-    def on_button_leave(self, event):
-        """Button reset"""
-        self.action_btn.configure(bg=self.primary_color)
+        """Reset hover once the pointer is outside the card"""
+        # Moving onto a child also sends <Leave> to the card; keep the highlight
+        widget = self.winfo_containing(event.x_root, event.y_root)
+        if widget is not None and (widget is self or str(widget).startswith(f"{self}.")):
+            return
+        self.configure(highlightbackground=CARD_BORDER)
 
 class ModernStatsPanel(tk.Frame):
     """Statistics panel with glass styling"""
     
-    def __init__(self, parent, usage_data, font_family):
-        super().__init__(parent, bg=ModernColors.BG_PRIMARY)
+    def __init__(self, parent, usage_data):
+        super().__init__(parent, bg=BG_PRIMARY)
         self.usage_data = usage_data
-        self.font_family = font_family
+        self._stat_widgets = []  # (value, caption) label pairs, reused on refresh
         self.create_stats_panel()
     
     def create_stats_panel(self):
         """Create stats panel"""
         stats_container = tk.Frame(self,
-                                  bg=ModernColors.GLASS_BG,
+                                  bg=GLASS_BG,
                                   relief="flat",
                                   bd=0,
                                   highlightthickness=1,
-                                  highlightbackground=ModernColors.GLASS_BORDER)
+                                  highlightbackground=GLASS_BORDER)
         stats_container.pack(fill=tk.X, padx=20, pady=10)
         
         # Header
-        header_frame = tk.Frame(stats_container, bg=ModernColors.GLASS_BG)
+        header_frame = tk.Frame(stats_container, bg=GLASS_BG)
         header_frame.pack(fill=tk.X, padx=24, pady=(18, 12))
         
         tk.Label(header_frame, text="Usage Analytics",
-                font=(self.font_family, 14, "bold"),
-                bg=ModernColors.GLASS_BG,
-                fg=ModernColors.TEXT_PRIMARY).pack(side=tk.LEFT)
+                font=_font(14, "bold"),
+                bg=GLASS_BG,
+                fg=TEXT_PRIMARY).pack(side=tk.LEFT)
         
         # Live indicator
-        live_frame = tk.Frame(header_frame, bg=ModernColors.GLASS_BG)
+        live_frame = tk.Frame(header_frame, bg=GLASS_BG)
         live_frame.pack(side=tk.RIGHT)
         
         tk.Label(live_frame, text="● LIVE",
-                font=(self.font_family, 9, "bold"),
-                fg=ModernColors.SUCCESS,
-                bg=ModernColors.GLASS_BG).pack()
+                font=_font(9, "bold"),
+                fg=SUCCESS,
+                bg=GLASS_BG).pack()
         
         # Stats grid
-        stats_grid = tk.Frame(stats_container, bg=ModernColors.GLASS_BG)
+        stats_grid = tk.Frame(stats_container, bg=GLASS_BG)
         stats_grid.pack(fill=tk.X, padx=24, pady=(0, 18))
         
         for i in range(4):
             stats_grid.grid_columnconfigure(i, weight=1)
         
         # Create stats
-        stats = [
-            ("Scans", self.usage_data.get("scan_count", 0), ModernColors.PRIMARY),
-            ("Replacements", self.usage_data.get("replace_count", 0), ModernColors.SUCCESS),
-            ("Sessions", self.usage_data.get("total_sessions", 0), ModernColors.WARNING),
-            ("Last Used", self.format_last_used(), ModernColors.TEXT_TERTIARY)
+        stats = self.get_stats()
+        for i in range(len(stats)):
+            self.create_stat_item(stats_grid, i)
+        self.update_values(stats)
+    
+    def get_stats(self):
+        """Stat (label, value, color) rows from the usage data"""
+        return [
+            ("Scans", self.usage_data.get("scan_count", 0), PRIMARY),
+            ("Replacements", self.usage_data.get("replace_count", 0), SUCCESS),
+            ("Sessions", self.usage_data.get("total_sessions", 0), WARNING),
+            ("Last Used", self.format_last_used(), TEXT_TERTIARY)
         ]
-        
-        for i, (label, value, color) in enumerate(stats):
-            self.create_stat_item(stats_grid, label, str(value), color, i)
+    
+    def update_values(self, stats):
+        """Write (label, value, color) rows into the existing stat widgets"""
+        for (value_label, caption_label), (label, value, color) in zip(self._stat_widgets, stats):
+            value_label.configure(text=str(value), fg=color)
+            caption_label.configure(text=label)
+    
+    def refresh(self, usage_data):
+        """Show new usage data in the existing stat widgets"""
+        self.usage_data = usage_data
+        self.update_values(self.get_stats())
     
     def format_last_used(self):
-        """Format last used date"""
-        last_used = self.usage_data.get("last_used", "Never")
-        if last_used == "Never":
-            return "Never"
-        try:
-            date_obj = datetime.fromisoformat(last_used)
-            return date_obj.strftime("%b %d")
-        except:
-            return "Never"
+        """Last used date, formatted when it was recorded"""
+        return self.usage_data.get("last_used_display", "Never")
     
-    def create_stat_item(self, parent, label, value, color, column):
-        """Create stat item"""
-        stat_frame = tk.Frame(parent, bg=ModernColors.GLASS_BG)
+    def create_stat_item(self, parent, column):
+        """Create stat item; text and color are filled in by update_values"""
+        stat_frame = tk.Frame(parent, bg=GLASS_BG)
         stat_frame.grid(row=0, column=column, padx=12, pady=8, sticky="ew")
         
-        tk.Label(stat_frame, text=value,
-                font=(self.font_family, 24, "bold"),
-                bg=ModernColors.GLASS_BG,
-                fg=color).pack()
+        value_label = tk.Label(stat_frame,
+                              font=_font(24, "bold"),
+                              bg=GLASS_BG)
+        value_label.pack()
         
-        tk.Label(stat_frame, text=label,
-                font=(self.font_family, 10, "normal"),
-                bg=ModernColors.GLASS_BG,
-                fg=ModernColors.TEXT_MUTED).pack(pady=(2, 0))
+        caption_label = tk.Label(stat_frame,
+                                font=_font(10, "normal"),
+                                bg=GLASS_BG,
+                                fg=TEXT_MUTED)
+        caption_label.pack(pady=(2, 0))
+        
+        self._stat_widgets.append((value_label, caption_label))
 
 class UltraModernLauncher:
     """Ultra-modern launcher application"""
     
+    WIDTH, HEIGHT = 1200, 900
+    
+    # Keyboard shortcuts: keysym -> method name, and the same for Control+key
+    _SHORTCUTS = {"F1": "launch_scan", "F2": "launch_replace", "Escape": "close_launcher"}
+    _CTRL_SHORTCUTS = {"r": "reset_stats"}
+    
     def __init__(self):
         self.root = None
-        self.font_family = self.get_system_font()
+        self.stats_panel = None
         self.usage_data = self.load_usage_data()
+        self._dirty = False  # usage_data changed since the last save
+        atexit.register(self._flush_if_dirty)
         
-    def get_system_font(self):
-        system = platform.system()
-        fonts = {
-            "Darwin": "SF Pro Display",
-            "Windows": "Segoe UI",
-            "Linux": "Ubuntu"
-        }
-        return fonts.get(system, "Arial")
-    
     def load_usage_data(self):
-        usage_file = Path("usage_stats.json")
+        usage_file = "usage_stats.json"
         default_data = {
             "scan_count": 0,
             "replace_count": 0,
             "last_used": "Never",
+            "last_used_display": "Never",
             "total_sessions": 0
         }
         
-        if usage_file.exists():
+        if os.path.exists(usage_file):
             try:
-                with open(usage_file, 'r') as f:
+                with open(usage_file, 'r', encoding='utf-8') as f:
                     data = json.load(f)
+                    # Stats saved before the display value was stored
+                    if "last_used_display" not in data:
+                        data["last_used_display"] = _format_last_used(data.get("last_used", "Never"))
                     return {**default_data, **data}
             except:
                 pass
@@ -356,11 +391,17 @@ class UltraModernLauncher:
     
     def save_usage_data(self):
         try:
-            with open("usage_stats.json", 'w') as f:
-                json.dump(self.usage_data, f, indent=2)
+            with open("usage_stats.json", 'w', encoding='utf-8') as f:
+                json.dump(self.usage_data, f, separators=(',', ':'), ensure_ascii=False)
         except:
             pass
     
+    def _flush_if_dirty(self):
+        """Save usage data only if it changed"""
+        if self._dirty:
+            self.save_usage_data()
+            self._dirty = False
+    
     def create_window(self):
         """Create modern window"""
         if self.root:
@@ -369,29 +410,33 @@ class UltraModernLauncher:
             except:
                 pass
         
+        # Cached fonts belong to the interpreter they were created in
+        _font.cache_clear()
         self.root = tk.Tk()
+        self.root.withdraw()  # Stay hidden until the interface is built
         self.root.title("Document Tools Suite")
-        self.root.geometry("1200x900")
-        self.root.configure(bg=ModernColors.BG_PRIMARY)
+        self.root.configure(bg=BG_PRIMARY)
         self.root.resizable(True, True)
         self.root.minsize(1000, 800)
         
-        if platform.system() == "Windows":
-            try:
-                self.root.wm_attributes("-alpha", 0.98)
-            except:
-                pass
+        # clam honours custom button colors on every platform
+        ttk.Style(self.root).theme_use("clam")
         
         self.create_interface()
         self.setup_shortcuts()
         self.center_window()
+        
+        # Show the finished window in one paint
+        self.root.update_idletasks()
+        self.root.deiconify()
+        self.root.focus_force()
     
     def create_interface(self):
         """Create interface"""
-        bg_canvas = BlurredBackground(self.root, 1200, 900)
+        bg_canvas = BlurredBackground(self.root, self.WIDTH, self.HEIGHT)
         bg_canvas.pack(fill=tk.BOTH, expand=True)
         
-        main_overlay = tk.Frame(bg_canvas, bg=ModernColors.BG_PRIMARY)
+        main_overlay = tk.Frame(bg_canvas, bg=BG_PRIMARY)
         main_overlay.place(relx=0, rely=0, relwidth=1, relheight=1)
         
         self.create_header(main_overlay)
@@ -401,61 +446,61 @@ class UltraModernLauncher:
     
     def create_header(self, parent):
         """Create header"""
-        header_frame = tk.Frame(parent, bg=ModernColors.BG_PRIMARY, height=140)
+        header_frame = tk.Frame(parent, bg=BG_PRIMARY, height=140)
         header_frame.pack(fill=tk.X, padx=60, pady=(40, 20))
         header_frame.pack_propagate(False)
         
-        title_container = tk.Frame(header_frame, bg=ModernColors.BG_PRIMARY)
+        title_container = tk.Frame(header_frame, bg=BG_PRIMARY)
         title_container.pack(expand=True, fill=tk.BOTH)
         
         tk.Label(title_container,
                 text="Document Tools Suite",
-                font=(self.font_family, 32, "bold"),
-                bg=ModernColors.BG_PRIMARY,
-                fg=ModernColors.TEXT_PRIMARY).pack(anchor="w")
+                font=_font(32, "bold"),
+                bg=BG_PRIMARY,
+                fg=TEXT_PRIMARY).pack(anchor="w")
         
         tk.Label(title_container,
                 text="Professional legal document processing platform",
-                font=(self.font_family, 14, "normal"),
-                bg=ModernColors.BG_PRIMARY,
-                fg=ModernColors.TEXT_SECONDARY).pack(anchor="w", pady=(4, 0))
+                font=_font(14, "normal"),
+                bg=BG_PRIMARY,
+                fg=TEXT_SECONDARY).pack(anchor="w", pady=(4, 0))
         
         # Version and status
-        meta_frame = tk.Frame(title_container, bg=ModernColors.BG_PRIMARY)
+        meta_frame = tk.Frame(title_container, bg=BG_PRIMARY)
         meta_frame.pack(anchor="w", pady=(16, 0), fill=tk.X)
         
         version_badge = tk.Frame(meta_frame,
-                                bg=ModernColors.GLASS_BG,
+                                bg=GLASS_BG,
                                 highlightthickness=1,
-                                highlightbackground=ModernColors.GLASS_BORDER)
+                                highlightbackground=GLASS_BORDER)
         version_badge.pack(side=tk.LEFT)
         
         tk.Label(version_badge, text="v3.0",
-                font=(self.font_family, 11, "bold"),
-                bg=ModernColors.GLASS_BG,
-                fg=ModernColors.PRIMARY,
+                font=_font(11, "bold"),
+                bg=GLASS_BG,
+                fg=PRIMARY,
                 padx=12, pady=6).pack()
         
-        status_frame = tk.Frame(meta_frame, bg=ModernColors.BG_PRIMARY)
+        status_frame = tk.Frame(meta_frame, bg=BG_PRIMARY)
         status_frame.pack(side=tk.LEFT, padx=(20, 0))
         
         # Dynamic status
         try:
             status_color, status_text = self.get_status_color_and_text()
         except AttributeError:
-            status_color, status_text = ModernColors.SUCCESS, "All systems operational"
+            status_color, status_text = SUCCESS, "All systems operational"
         
         tk.Label(status_frame, text=f"● {status_text}",
-                font=(self.font_family, 11, "normal"),
+                font=_font(11, "normal"),
                 fg=status_color,
-                bg=ModernColors.BG_PRIMARY).pack()
+                bg=BG_PRIMARY).pack()
     
     def create_tools_section(self, parent):
         """Create tools section"""
-        tools_frame = tk.Frame(parent, bg=ModernColors.BG_PRIMARY)
+        tools_frame = tk.Frame(parent, bg=BG_PRIMARY)
         tools_frame.pack(fill=tk.BOTH, expand=True, padx=60, pady=(20, 30))
         
-        grid_container = tk.Frame(tools_frame, bg=ModernColors.BG_PRIMARY)
+        grid_container = tk.Frame(tools_frame, bg=BG_PRIMARY)
         grid_container.pack(fill=tk.X, pady=20)
         
         grid_container.grid_columnconfigure(0, weight=1)
@@ -467,7 +512,7 @@ class UltraModernLauncher:
             title="DocXScan",
             subtitle="Advanced document scanner with intelligent token detection, pattern matching, and comprehensive analysis capabilities",
             icon="🔍",
-            primary_color=ModernColors.PRIMARY,
+            primary_color=PRIMARY,
             command=self.launch_scan,
             shortcut="F1"
         )
@@ -479,7 +524,7 @@ class UltraModernLauncher:
             title="DocXReplace",
             subtitle="Professional document token replacement with advanced regex support, batch processing, and intelligent pattern migration",
             icon="🔄",
-            primary_color=ModernColors.SUCCESS,
+            primary_color=SUCCESS,
             command=self.launch_replace,
             shortcut="F2"
         )
@@ -487,48 +532,53 @@ class UltraModernLauncher:
     
     def create_stats_section(self, parent):
         """Create stats section"""
-        stats_frame = tk.Frame(parent, bg=ModernColors.BG_PRIMARY)
+        stats_frame = tk.Frame(parent, bg=BG_PRIMARY)
         stats_frame.pack(fill=tk.X, padx=60, pady=(0, 30))
         
-        stats_panel = ModernStatsPanel(stats_frame, self.usage_data, self.font_family)
-        stats_panel.pack(fill=tk.X)
+        self.stats_panel = ModernStatsPanel(stats_frame, self.usage_data)
+        self.stats_panel.pack(fill=tk.X)
     
     def create_footer(self, parent):
         """Create footer"""
-        footer_frame = tk.Frame(parent, bg=ModernColors.BG_PRIMARY)
+        footer_frame = tk.Frame(parent, bg=BG_PRIMARY)
         footer_frame.pack(side=tk.BOTTOM, fill=tk.X, padx=60, pady=(0, 30))
         
         tk.Label(footer_frame,
                 text="© 2025 Hrishik Kunduru • Document Tools Suite • All Rights Reserved",
-                font=(self.font_family, 10, "normal"),
-                bg=ModernColors.BG_PRIMARY,
-                fg=ModernColors.TEXT_MUTED).pack()
+                font=_font(10, "normal"),
+                bg=BG_PRIMARY,
+                fg=TEXT_MUTED).pack()
     
     def setup_shortcuts(self):
-        """Setup shortcuts"""
-        self.root.bind('<F1>', lambda e: self.launch_scan())
-        self.root.bind('<F2>', lambda e: self.launch_replace())
-        self.root.bind('<Escape>', lambda e: self.close_launcher())
-        self.root.bind('<Control-r>', lambda e: self.reset_stats())
-        self.root.focus_force()
+        """Setup shortcuts through one key dispatcher"""
+        self.root.bind('<Key>', self._dispatch_key)
+    
+    def _dispatch_key(self, event):
+        """Run the shortcut bound to a key press, if any"""
+        if event.state & 0x4:  # Control held
+            name = self._CTRL_SHORTCUTS.get(event.keysym)
+        else:
+            name = self._SHORTCUTS.get(event.keysym)
+        if name:
+            getattr(self, name)()
     
     def reset_stats(self):
         """Reset statistics"""
+        from tkinter import messagebox
         if messagebox.askyesno("Reset Statistics", "Reset all usage statistics to zero?"):
             self.usage_data = {
                 "scan_count": 0,
                 "replace_count": 0,
                 "last_used": "Never",
+                "last_used_display": "Never",
                 "total_sessions": 1
             }
-            self.save_usage_data()
-            self.create_window()
+            self._dirty = True
+            self.stats_panel.refresh(self.usage_data)
     
     def center_window(self):
-        """Center window"""
-        self.root.update_idletasks()
-        width = self.root.winfo_width()
-        height = self.root.winfo_height()
+        """Size and center window in one geometry call"""
+        width, height = self.WIDTH, self.HEIGHT
         x = (self.root.winfo_screenwidth() // 2) - (width // 2)
         y = (self.root.winfo_screenheight() // 2) - (height // 2)
         self.root.geometry(f'{width}x{height}+{x}+{y}')
@@ -536,7 +586,7 @@ class UltraModernLauncher:
     def close_launcher(self):
         """Close launcher"""
         try:
-            self.save_usage_data()
+            self._flush_if_dirty()
             if self.root:
                 self.root.destroy()
                 self.root = None
@@ -547,7 +597,7 @@ class UltraModernLauncher:
         """Run launcher"""
         try:
             self.usage_data["total_sessions"] += 1
-            self.save_usage_data()
+            self._dirty = True
             
             self.create_window()
             self.root.protocol("WM_DELETE_WINDOW", self.close_launcher)
@@ -559,10 +609,16 @@ class UltraModernLauncher:
     
     def launch_scan(self):
         """Launch DocXScan EXE and close launcher"""
+        # Only needed once a tool is launched, so kept out of startup
+        import subprocess
+        from datetime import datetime
+        from tkinter import messagebox
         try:
             self.usage_data["scan_count"] += 1
-            self.usage_data["last_used"] = datetime.now().isoformat()
-            self.save_usage_data()
+            now = datetime.now()
+            self.usage_data["last_used"] = now.isoformat()
+            self.usage_data["last_used_display"] = now.strftime("%b %d")
+            self._dirty = True
             
             # Launch the EXE from its folder
             subprocess.Popen(["DocXScan/DocXScan.exe"])
@@ -577,10 +633,15 @@ class UltraModernLauncher:
     
     def launch_replace(self):
         """Launch DocXReplace EXE and close launcher"""
+        import subprocess
+        from datetime import datetime
+        from tkinter import messagebox
         try:
             self.usage_data["replace_count"] += 1
-            self.usage_data["last_used"] = datetime.now().isoformat()
-            self.save_usage_data()
+            now = datetime.now()
+            self.usage_data["last_used"] = now.isoformat()
+            self.usage_data["last_used_display"] = now.strftime("%b %d")
+            self._dirty = True
             
             # Launch the EXE from its folder
             subprocess.Popen(["DocXReplace/DocXReplace.exe"])
@@ -1,12 +1,28 @@
 import tkinter as tk
-import tempfile
 from tkinter import filedialog, messagebox, ttk
 import os
 import re
 import zipfile
-import pandas as pd
+import html
+import mmap
+import shutil
+import tempfile
+import threading
+import queue
+import multiprocessing
+from collections import deque
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None  # Prefilter falls back to plain substring checks
+try:
+    import re2  # google-re2: linear-time screening of each line
+except ImportError:
+    re2 = None
+import xlsxwriter
 from datetime import datetime
-from docx import Document
 # -----------------------------------------------------------------------------
 # DocXScan_1.5.py
 # Copyright © 2025 Hrishik Kunduru. All rights reserved.
@@ -15,29 +31,12 @@ from docx import Document
 # without written permission.
 # -----------------------------------------------------------------------------
 
-root = tk.Tk()
-root.title("DocXScan v1.5")
-root.geometry("650x700")
-
 bg_color = "#1e1e1e"
 fg_color = "#ffffff"
 entry_bg = "#2d2d2d"
 btn_bg = "#3c3c3c"
 btn_fg = "#ffffff"
 
-root.configure(bg=bg_color)
-
-selected_folder = tk.StringVar()
-zip_folder = tk.StringVar()
-zip_name = tk.StringVar(value="matched_files")
-file_type_choice = tk.StringVar(value="Both (.docx and .dcp.docx)")
-pattern_choice = tk.StringVar(value="PROMTINTO")
-custom_pattern = tk.StringVar()
-
-style = ttk.Style()
-style.theme_use("default")
-style.configure("TCombobox", fieldbackground=entry_bg, background=entry_bg, foreground=fg_color)
-
 def browse_folder():
     path = filedialog.askdirectory()
     if path:
@@ -48,39 +47,271 @@ def browse_zip_folder():
     if path:
         zip_folder.set(path)
 
+_log_queue = queue.Queue()
+
 def log(msg):
-    console_box.insert(tk.END, msg + "\n")
-    console_box.see(tk.END)
+    # Safe to call from any thread; drain_log writes the text on the Tk thread
+    _log_queue.put(msg)
 
-def extract_full_text_lines(doc):
+def drain_log():
+    # One insert and one scroll per tick, however many messages arrived
+    msgs = []
+    while True:
+        try:
+            msgs.append(_log_queue.get_nowait())
+        except queue.Empty:
+            break
+    if msgs:
+        console_box.insert(tk.END, "\n".join(msgs) + "\n")
+        console_box.see(tk.END)
+    root.after(100, drain_log)
+
+def start_indeterminate_progress():
+    # Used while the folder walk is still running and the total is unknown
+    progress.config(mode="indeterminate")
+    progress.start(15)
+
+def set_progress(value, maximum=None):
+    if maximum is not None:
+        progress.stop()
+        progress.config(mode="determinate", maximum=maximum)
+    progress["value"] = value
+
+def poll_progress(state):
+    # Runs on the Tk thread every 100 ms while a scan is active; the scan
+    # thread only bumps the byte counters in `state` instead of queueing a
+    # redraw per file
+    if not state["running"]:
+        # Finished or failed, possibly before the walk ended: always leave
+        # the bar stopped and determinate with the final counts
+        total = state["total"] if state["total"] is not None else state["done"]
+        set_progress(state["done"], total or 1)
+        return
+    if state["total"] is not None:
+        if str(progress["mode"]) == "indeterminate":
+            set_progress(state["done"], state["total"] or 1)  # Tk needs a non-zero maximum
+        else:
+            progress["value"] = state["done"]
+    root.after(100, poll_progress, state)
+
+def iter_files(folder, file_filter):
+    # Yield os.DirEntry objects for matching files, in os.walk order,
+    # without building the full file list first. file_filter is a pair of
+    # suffix tuples (include, exclude) for str.endswith.
+    include, exclude = file_filter
+    stack = [folder]
+    while stack:
+        directory = stack.pop()
+        subdirs = []
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif (entry.name.endswith(include) and not entry.name.endswith(exclude)
+                          and entry.is_file()):
+                        yield entry
+        except OSError:
+            continue
+        stack.extend(reversed(subdirs))
+
+# Text runs, tabs and breaks, and paragraph ends in word/document.xml
+_RUN_RE = re.compile(rb'<w:t(?:\s[^>]*)?>([^<]*)</w:t>|<w:(tab)/>|<w:(br|cr)\b[^>]*/>|</w:p>')
+# Just the text runs, for the prefilter
+_WT_RE = re.compile(rb'<w:t(?:\s[^>]*)?>([^<]*)</w:t>')
+_REGEX_META = set('.^$*+?[]\\|()')
+_QUANTIFIER_RE = re.compile(r'[?*+]|\{\d*,?\d*\}')
+
+# document.xml parts at least this large are memory-mapped instead of read
+_MMAP_THRESHOLD = 8 * 1024 * 1024
+
+_UTF16_BOMS = (b'\xff\xfe', b'\xfe\xff')
+
+def _as_utf8(xml):
+    # The byte regexes only understand UTF-8, so re-encode the rare UTF-16
+    # document.xml (detected by its BOM) instead of finding nothing in it
+    if xml[:2] in _UTF16_BOMS:  # Slice, as mmap has no startswith
+        return xml[:].decode('utf-16').encode('utf-8')
+    return xml
+
+@contextmanager
+def open_document_xml(file_path):
+    # Yields the bytes of word/document.xml. Large parts are decompressed to a
+    # temporary file and memory-mapped, so the worker never holds the whole
+    # XML as one bytes object; the regexes run on the mmap directly.
+    # UTF-16 parts are yielded re-encoded as UTF-8.
+    with zipfile.ZipFile(file_path) as zf:
+        info = zf.getinfo('word/document.xml')
+        if info.file_size < _MMAP_THRESHOLD:
+            yield _as_utf8(zf.read(info))
+            return
+        with tempfile.TemporaryFile() as tmp:
+            with zf.open(info) as src:
+                shutil.copyfileobj(src, tmp, 1024 * 1024)
+            tmp.flush()
+            with mmap.mmap(tmp.fileno(), 0, access=mmap.ACCESS_READ) as xml:
+                yield _as_utf8(xml)
+
+def extract_text_fast(xml):
+    # Rebuild one line per paragraph (table cells included) from the bytes of
+    # document.xml without building a python-docx tree
     lines = []
-    for para in doc.paragraphs:
-        lines.append(para.text)
-    for table in doc.tables:
-        for row in table.rows:
-            for cell in row.cells:
-                lines.append(cell.text)
+    parts = []
+    for m in _RUN_RE.finditer(xml):
+        text, tab, brk = m.groups()
+        if text is not None:
+            parts.append(text)
+        elif tab:
+            parts.append(b'\t')
+        elif brk:
+            parts.append(b'\n')
+        else:
+            lines.append(html.unescape(b''.join(parts).decode('utf-8')))
+            parts = []
     return lines
 
-def get_matching_lines_combined(file_path, patterns):
+_BACKREF_RE = re.compile(r'\\[1-9]|\(\?P=')
+
+def _build_combined(patterns):
+    # One alternation of all patterns, used as a per-line gate so most lines
+    # are rejected with a single search. Lines that pass are checked against
+    # each compiled pattern, since an alternation reports only one pattern per
+    # position (e.g. 'PROMTINTO' and 'PROMTINTOIIF' on "PROMTINTOIIF(x)").
+    # Joining renumbers capture groups, so a pattern with a backreference
+    # turns the gate off.
+    singles = [(p, re.compile(p)) for p in patterns]
+    if any(_BACKREF_RE.search(p) for p in patterns):
+        return None, singles
     try:
-        doc = Document(file_path)
-        lines = extract_full_text_lines(doc)
-        matched_lines = []
-        matched_patterns = set()
-        for line in lines:
-            for pattern in patterns:
-                if re.search(pattern, line):
-                    matched_lines.append(line.strip())
-                    matched_patterns.add(pattern)
-        return list(matched_patterns), matched_lines
+        combined = re.compile("|".join(f"(?:{p})" for p in patterns))
+    except re.error:
+        combined = None  # e.g. custom patterns with global flags; no gate
+    return combined, singles
+
+def _literal_prefix(pattern):
+    # Literal text every match of pattern starts with, or '' if there is none
+    if '|' in pattern:
+        return ''
+    prefix = []
+    i = 0
+    while i < len(pattern):
+        c = pattern[i]
+        if c == '\\':
+            if i + 1 == len(pattern) or pattern[i + 1].isalnum():
+                break  # Class or special escape like \d or \b
+            c = pattern[i + 1]
+            step = 2
+        elif c in _REGEX_META:
+            break
+        else:
+            step = 1
+        if _QUANTIFIER_RE.match(pattern, i + step):
+            break  # This character is optional or repeated
+        prefix.append(c)
+        i += step
+    return ''.join(prefix)
+
+def _build_prefilter(patterns):
+    # Returns a check on the raw document.xml that is False only when no
+    # pattern can match its text, or None if some pattern has no literal prefix
+    prefixes = [_literal_prefix(p) for p in patterns]
+    if not prefixes or not all(prefixes):
+        return None
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for prefix in prefixes:
+            automaton.add_word(prefix, prefix)
+        automaton.make_automaton()
+
+        def contains_prefix(text):
+            return next(automaton.iter(text), None) is not None
+    else:
+        def contains_prefix(text):
+            return any(prefix in text for prefix in prefixes)
+
+    def prefilter(xml):
+        # Joining the runs brings back tokens that Word split across runs
+        text = html.unescape(b''.join(_WT_RE.findall(xml)).decode('utf-8', 'replace'))
+        return contains_prefix(text)
+    return prefilter
+
+_CLASS_ESCAPE_RE = re.compile(r'\\[wWdDsSbB]')
+
+def _build_screen(patterns):
+    # RE2 alternation of all patterns, used to skip lines no pattern can match
+    # before the Python regex runs. None if re2 is missing or rejects a pattern
+    # (e.g. lookarounds or backreferences). Also None when a pattern uses a
+    # class escape: RE2's \w \d \s \b are ASCII-only, Python's match Unicode
+    if re2 is None or not patterns or any(_CLASS_ESCAPE_RE.search(p) for p in patterns):
+        return None
+    try:
+        return re2.compile("|".join(f"(?:{p})" for p in patterns))
+    except re2.error:
+        return None
+
+def get_matching_lines_combined(file_path, combined, singles, prefilter=None, screen=None,
+                                stop_early=False):
+    with open_document_xml(file_path) as xml:
+        if prefilter is not None and not prefilter(xml):
+            return [], []
+        lines = extract_text_fast(xml)
+    matched_lines = []
+    matched_patterns = set()
+    pattern_count = len({p for p, _ in singles})
+    for line in lines:
+        if screen is not None and not screen.search(line):
+            continue
+        if combined is not None and not combined.search(line):
+            continue
+        hits = {p for p, pat in singles if pat.search(line)}
+        if hits:
+            matched_lines.append(line.strip())
+            matched_patterns.update(hits)
+            if stop_early and len(matched_patterns) == pattern_count:
+                break  # Quick scan: every pattern has been seen in this file
+    return list(matched_patterns), matched_lines
+
+REPORT_HEADERS = ('File Name', 'Size (bytes)', 'Creation Date', 'Modified Date',
+                  'Matched Pattern', 'Matched Line(s)')
+
+def write_report(excel_filename, rows):
+    # Stream row tuples with xlsxwriter's constant_memory mode instead of
+    # building a DataFrame; cell text is written as-is, never as formulas or links
+    workbook = xlsxwriter.Workbook(excel_filename, {
+        'constant_memory': True,
+        'strings_to_formulas': False,
+        'strings_to_urls': False,
+    })
+    try:
+        worksheet = workbook.add_worksheet()
+        header_format = workbook.add_format({'bold': True, 'border': 1, 'align': 'center'})
+        worksheet.write_row(0, 0, REPORT_HEADERS, header_format)
+        for i, row in enumerate(rows, 1):
+            worksheet.write_row(i, 0, row)
+    finally:
+        workbook.close()
+
+# Matchers for the current scan, built once per worker process
+_worker_combined = None
+_worker_prefilter = None
+_worker_screen = None
+_worker_stop_early = False
+
+def _init_worker(patterns, stop_early):
+    global _worker_combined, _worker_prefilter, _worker_screen, _worker_stop_early
+    _worker_combined = _build_combined(patterns)
+    _worker_prefilter = _build_prefilter(patterns)
+    _worker_screen = _build_screen(patterns)
+    _worker_stop_early = stop_early
+
+def _scan_one(file_path):
+    # Runs in a worker process, so errors come back as a message for the log
+    try:
+        return get_matching_lines_combined(file_path, *_worker_combined,
+                                           _worker_prefilter, _worker_screen,
+                                           _worker_stop_early) + (None,)
     except Exception as e:
-        log(f"Error reading {file_path}: {e}")
-        return [], []
-
-# Progress bar widget
-progress = ttk.Progressbar(root, orient="horizontal", length=600, mode="determinate")
-progress.pack(padx=10, pady=(0, 10))
+        return [], [], f"Error reading {file_path}: {e}"
 
 def scan_docs():
     folder = selected_folder.get().strip()
@@ -98,9 +329,9 @@ def scan_docs():
         return
 
     file_type_map = {
-        "Only .dcp.docx": lambda f: f.endswith('.dcp.docx'),
-        "Only .docx (excluding .dcp.docx)": lambda f: f.endswith('.docx') and not f.endswith('.dcp.docx'),
-        "Both (.docx and .dcp.docx)": lambda f: f.endswith('.docx')
+        "Only .dcp.docx": (('.dcp.docx',), ()),
+        "Only .docx (excluding .dcp.docx)": (('.docx',), ('.dcp.docx',)),
+        "Both (.docx and .dcp.docx)": (('.docx',), ())
     }
 
     file_filter = file_type_map.get(file_type_choice.get())
@@ -134,102 +365,169 @@ def scan_docs():
     else:
         patterns = pattern_map.get(choice, [])
 
-    matching_files = []
-    metadata = []
-
-    all_files = []
-    for root_dir, _, files in os.walk(folder):
-        for file in files:
-            if file_filter(file):
-                all_files.append(os.path.join(root_dir, file))
-
-    progress["maximum"] = len(all_files)
-    progress["value"] = 0
-    root.update_idletasks()
-
-    for i, full_path in enumerate(all_files):
-        matched_patterns, matched_lines = get_matching_lines_combined(full_path, patterns)
-        if matched_lines:
-            matching_files.append(full_path)
-            info = os.stat(full_path)
-            metadata.append({
-                'File Name': os.path.basename(full_path),
-                'Size (bytes)': info.st_size,
-                'Creation Date': datetime.fromtimestamp(info.st_ctime).strftime('%Y-%m-%d %H:%M:%S'),
-                'Modified Date': datetime.fromtimestamp(info.st_mtime).strftime('%Y-%m-%d %H:%M:%S'),
-                'Matched Pattern': ', '.join(matched_patterns),
-                'Matched Line(s)': '/----/'.join(matched_lines)
-            })
-        progress["value"] = i + 1
-        root.update_idletasks()
-
-    if not matching_files:
-        log("No matching files found.")
-        return
+    # Scan in the background so the window stays responsive
+    scan_button.config(state="disabled")
+    state = {"done": 0, "total": None, "running": True}
+    start_indeterminate_progress()
+    root.after(100, poll_progress, state)
+    threading.Thread(target=run_scan,
+                     args=(folder, zip_dest, zip_filename_base, file_filter, patterns, state,
+                           quick_scan.get()),
+                     daemon=True).start()
+
+def run_scan(folder, zip_dest, zip_filename_base, file_filter, patterns, state, stop_early=False):
+    # Background thread: Tk widgets are only updated through root.after, while
+    # progress goes through `state` and messages through the log queue
+    try:
+        matching_files = []
+        metadata = []
+
+        # Walk and stat the whole tree before scanning, so the byte total is
+        # known up front and the bar is indeterminate only during the walk.
+        # Progress is measured in bytes, since large documents take
+        # proportionally longer to scan than small ones
+        files = deque()
+        walked_bytes = 0
+        for entry in iter_files(folder, file_filter):
+            try:
+                info = entry.stat()  # Cached on the DirEntry; free on Windows
+            except OSError as e:
+                log(f"Error reading {entry.path}: {e}")  # e.g. deleted mid-walk
+                continue
+            walked_bytes += info.st_size
+            files.append((entry, info))
+        state["total"] = walked_bytes
+        log(f"Scanning {len(files)} files ({walked_bytes / (1024 * 1024):.1f} MB)...")
+
+        # At most max_pending files are in flight, and results are handled
+        # in walk order
+        max_pending = 4 * (os.cpu_count() or 1)
+        pending = deque()
+        done_bytes = 0
+        with ProcessPoolExecutor(initializer=_init_worker, initargs=(patterns, stop_early)) as executor:
+            while files or pending:
+                while files and len(pending) < max_pending:
+                    entry, info = files.popleft()
+                    pending.append((entry, info, executor.submit(_scan_one, entry.path)))
+
+                entry, info, future = pending.popleft()
+                matched_patterns, matched_lines, error = future.result()
+                done_bytes += info.st_size
+                state["done"] = done_bytes
+                if error:
+                    log(error)
+                if matched_lines:
+                    matching_files.append(entry.path)
+                    metadata.append((
+                        entry.name,
+                        info.st_size,
+                        datetime.fromtimestamp(info.st_ctime).strftime('%Y-%m-%d %H:%M:%S'),
+                        datetime.fromtimestamp(info.st_mtime).strftime('%Y-%m-%d %H:%M:%S'),
+                        ', '.join(matched_patterns),
+                        '/----/'.join(matched_lines)
+                    ))
+
+        if not matching_files:
+            log("No matching files found.")
+            return
+
+        excel_filename = os.path.join(folder, 'matching_files_metadata.xlsx')
+        write_report(excel_filename, metadata)
+
+        zip_path = os.path.join(zip_dest, zip_filename_base + '.zip')
+        # Archive matched files straight from their folders; as before, the
+        # last file wins when two share a name. The .docx files are already
+        # deflated internally, so a fast level gives nearly the same size
+        archive_files = {os.path.basename(file): file for file in matching_files}
 
-    excel_filename = os.path.join(folder, 'matching_files_metadata.xlsx')
-    pd.DataFrame(metadata).to_excel(excel_filename, index=False)
-
-    zip_path = os.path.join(zip_dest, zip_filename_base + '.zip')
-    matched_folder = tempfile.mkdtemp(prefix='Matched_Files_')  # Temporary directory
-    # Directory already created by tempfile
-    for file in matching_files:
-        dest = os.path.join(matched_folder, os.path.basename(file))
-        with open(file, 'rb') as src, open(dest, 'wb') as dst:
-            dst.write(src.read())
-
-    with zipfile.ZipFile(zip_path, 'w') as zipf:
-        zipf.write(excel_filename, arcname='matching_files_metadata.xlsx')
-        for file in os.listdir(matched_folder):
-            zipf.write(os.path.join(matched_folder, file), arcname=os.path.join('Matched_Files', file))
-
-    log(f"\n✅ Done. {len(matching_files)} matching files found.")
-    log(f"📄 Excel saved: {excel_filename}")
-    log(f"🗜️ ZIP archive created: {zip_path}")
-
-tk.Label(root, text="1. Select Folder to Scan:", bg=bg_color, fg=fg_color).pack(anchor="w", padx=10, pady=(10, 0))
-tk.Button(root, text="Browse Folder", command=browse_folder, bg=btn_bg, fg=btn_fg).pack(anchor="w", padx=10)
-tk.Label(root, textvariable=selected_folder, fg="#4aa3ff", bg=bg_color).pack(anchor="w", padx=10)
-
-tk.Label(root, text="2. Select File Type:", bg=bg_color, fg=fg_color).pack(anchor="w", padx=10, pady=(10, 0))
-ttk.Combobox(root, textvariable=file_type_choice, values=[
-    "Only .dcp.docx",
-    "Only .docx (excluding .dcp.docx)",
-    "Both (.docx and .dcp.docx)"
-], width=40).pack(anchor="w", padx=10)
-
-tk.Label(root, text="3. Select Pattern:", bg=bg_color, fg=fg_color).pack(anchor="w", padx=10, pady=(10, 0))
-ttk.Combobox(root, textvariable=pattern_choice, values=[
-    "PROMTINTO",
-    "PROMTINTOIIF",
-    "PROMTINTOLIST",
-    "PROMTINTOIIFLIST",
-    "PROMTFORM",
-    "CHECKLIST",
-    "TABLES",
-    "JFIG",
-    "JFIG_General",
-    "ESIGN",
-    "SPECIAL",    
-    "Custom (Type in prompt below)"
-], width=40).pack(anchor="w", padx=10)
-
-tk.Entry(root, textvariable=custom_pattern, width=80, bg=entry_bg, fg=fg_color, insertbackground=fg_color).pack(anchor="w", padx=10)
-
-tk.Label(root, text="4. ZIP Destination Folder:", bg=bg_color, fg=fg_color).pack(anchor="w", padx=10, pady=(10, 0))
-tk.Button(root, text="Browse ZIP Folder", command=browse_zip_folder, bg=btn_bg, fg=btn_fg).pack(anchor="w", padx=10)
-tk.Label(root, textvariable=zip_folder, fg="#4aa3ff", bg=bg_color).pack(anchor="w", padx=10)
-
-tk.Label(root, text="5. ZIP File Name:", bg=bg_color, fg=fg_color).pack(anchor="w", padx=10, pady=(10, 0))
-tk.Entry(root, textvariable=zip_name, width=50, bg=entry_bg, fg=fg_color, insertbackground=fg_color).pack(anchor="w", padx=10)
-
-tk.Button(root, text="Start Scan", bg="#007acc", fg="white", command=scan_docs).pack(pady=10)
-
-tk.Label(root, text="Console Output:", bg=bg_color, fg=fg_color).pack(anchor="w", padx=10)
-console_box = tk.Text(root, height=14, width=90, bg=entry_bg, fg=fg_color, insertbackground=fg_color)
-console_box.pack(padx=10, pady=(0, 10))
-
-tk.Label(root, text="© 2025 Hrishik Kunduru - All rights reserved",
-         bg=bg_color, fg="#888888", font=("Arial", 9)).pack(side="bottom", pady=5)
-
-root.mainloop()
\ No newline at end of file
+        with zipfile.ZipFile(zip_path, 'w', compression=zipfile.ZIP_DEFLATED, compresslevel=3) as zipf:
+            zipf.write(excel_filename, arcname='matching_files_metadata.xlsx')
+            for name, file in archive_files.items():
+                zipf.write(file, arcname=f'Matched_Files/{name}')
+
+        log(f"\n✅ Done. {len(matching_files)} matching files found.")
+        log(f"📄 Excel saved: {excel_filename}")
+        log(f"🗜️ ZIP archive created: {zip_path}")
+    except Exception as e:
+        log(f"❌ Scan failed: {e}")
+    finally:
+        state["running"] = False
+        root.after(0, lambda: scan_button.config(state="normal"))
+
+if __name__ == "__main__":
+    # Worker processes re-import this file; only the main process builds the UI
+    multiprocessing.freeze_support()
+
+    root = tk.Tk()
+    root.title("DocXScan v1.5")
+    root.geometry("650x700")
+
+    root.configure(bg=bg_color)
+
+    selected_folder = tk.StringVar()
+    zip_folder = tk.StringVar()
+    zip_name = tk.StringVar(value="matched_files")
+    file_type_choice = tk.StringVar(value="Both (.docx and .dcp.docx)")
+    pattern_choice = tk.StringVar(value="PROMTINTO")
+    custom_pattern = tk.StringVar()
+    quick_scan = tk.BooleanVar(value=False)
+
+    style = ttk.Style()
+    style.theme_use("default")
+    style.configure("TCombobox", fieldbackground=entry_bg, background=entry_bg, foreground=fg_color)
+
+    # Progress bar widget
+    progress = ttk.Progressbar(root, orient="horizontal", length=600, mode="determinate")
+    progress.pack(padx=10, pady=(0, 10))
+
+    tk.Label(root, text="1. Select Folder to Scan:", bg=bg_color, fg=fg_color).pack(anchor="w", padx=10, pady=(10, 0))
+    tk.Button(root, text="Browse Folder", command=browse_folder, bg=btn_bg, fg=btn_fg).pack(anchor="w", padx=10)
+    tk.Label(root, textvariable=selected_folder, fg="#4aa3ff", bg=bg_color).pack(anchor="w", padx=10)
+
+    tk.Label(root, text="2. Select File Type:", bg=bg_color, fg=fg_color).pack(anchor="w", padx=10, pady=(10, 0))
+    ttk.Combobox(root, textvariable=file_type_choice, values=[
+        "Only .dcp.docx",
+        "Only .docx (excluding .dcp.docx)",
+        "Both (.docx and .dcp.docx)"
+    ], width=40).pack(anchor="w", padx=10)
+
+    tk.Label(root, text="3. Select Pattern:", bg=bg_color, fg=fg_color).pack(anchor="w", padx=10, pady=(10, 0))
+    ttk.Combobox(root, textvariable=pattern_choice, values=[
+        "PROMTINTO",
+        "PROMTINTOIIF",
+        "PROMTINTOLIST",
+        "PROMTINTOIIFLIST",
+        "PROMTFORM",
+        "CHECKLIST",
+        "TABLES",
+        "JFIG",
+        "JFIG_General",
+        "ESIGN",
+        "SPECIAL",
+        "Custom (Type in prompt below)"
+    ], width=40).pack(anchor="w", padx=10)
+
+    tk.Entry(root, textvariable=custom_pattern, width=80, bg=entry_bg, fg=fg_color, insertbackground=fg_color).pack(anchor="w", padx=10)
+    tk.Checkbutton(root, text="Quick scan (stop reading a file once every pattern has matched)",
+                   variable=quick_scan, bg=bg_color, fg=fg_color, selectcolor=entry_bg,
+                   activebackground=bg_color, activeforeground=fg_color).pack(anchor="w", padx=10, pady=(5, 0))
+
+    tk.Label(root, text="4. ZIP Destination Folder:", bg=bg_color, fg=fg_color).pack(anchor="w", padx=10, pady=(10, 0))
+    tk.Button(root, text="Browse ZIP Folder", command=browse_zip_folder, bg=btn_bg, fg=btn_fg).pack(anchor="w", padx=10)
+    tk.Label(root, textvariable=zip_folder, fg="#4aa3ff", bg=bg_color).pack(anchor="w", padx=10)
+
+    tk.Label(root, text="5. ZIP File Name:", bg=bg_color, fg=fg_color).pack(anchor="w", padx=10, pady=(10, 0))
+    tk.Entry(root, textvariable=zip_name, width=50, bg=entry_bg, fg=fg_color, insertbackground=fg_color).pack(anchor="w", padx=10)
+
+    scan_button = tk.Button(root, text="Start Scan", bg="#007acc", fg="white", command=scan_docs)
+    scan_button.pack(pady=10)
+
+    tk.Label(root, text="Console Output:", bg=bg_color, fg=fg_color).pack(anchor="w", padx=10)
+    console_box = tk.Text(root, height=14, width=90, bg=entry_bg, fg=fg_color, insertbackground=fg_color)
+    console_box.pack(padx=10, pady=(0, 10))
+
+    tk.Label(root, text="© 2025 Hrishik Kunduru - All rights reserved",
+             bg=bg_color, fg="#888888", font=("Arial", 9)).pack(side="bottom", pady=5)
+
+    root.after(100, drain_log)
+    root.mainloop()
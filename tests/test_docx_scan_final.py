@@ -0,0 +1,62 @@
+import importlib.util
+import os
+import tempfile
+import unittest
+import zipfile
+
+SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                      'docx_scan_final_1.0.py')
+
+spec = importlib.util.spec_from_file_location('docx_scan_final', SCRIPT)
+scan = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(scan)
+
+
+def make_docx(path, *paragraphs, encoding='utf-8'):
+    body = ''.join(f'<w:p><w:r><w:t>{text}</w:t></w:r></w:p>' for text in paragraphs)
+    xml = (f'<?xml version="1.0" encoding="{encoding.upper()}" standalone="yes"?>'
+           '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+           f'<w:body>{body}</w:body></w:document>')
+    with zipfile.ZipFile(path, 'w') as zf:
+        zf.writestr('word/document.xml', xml.encode(encoding))
+    return path
+
+
+def find(path, patterns):
+    return scan.get_matching_lines_combined(
+        path, *scan._build_combined(patterns), scan._build_prefilter(patterns),
+        scan._build_screen(patterns))
+
+
+class MatchingTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_pattern_that_prefixes_another_reports_both(self):
+        path = make_docx(os.path.join(self.tmp.name, 'a.docx'), 'PROMTINTOIIF(x)', 'no tokens here')
+        matched, lines = find(path, ['PROMTINTO', 'PROMTINTOIIF'])
+        self.assertEqual(sorted(matched), ['PROMTINTO', 'PROMTINTOIIF'])
+        self.assertEqual(lines, ['PROMTINTOIIF(x)'])
+
+    def test_backreference_pattern_keeps_its_groups(self):
+        path = make_docx(os.path.join(self.tmp.name, 'd.docx'), 'abab here')
+        matched, lines = find(path, [r'(z)zz', r'(ab)\1'])
+        self.assertEqual(matched, [r'(ab)\1'])
+        self.assertEqual(lines, ['abab here'])
+
+    def test_class_escapes_match_unicode_text(self):
+        path = make_docx(os.path.join(self.tmp.name, 'b.docx'), 'ééé', 'José ٣٤')
+        matched, lines = find(path, [r'\w{3}', r'\bJosé\b', r'\d\d'])
+        self.assertEqual(sorted(matched), [r'\bJosé\b', r'\d\d', r'\w{3}'])
+        self.assertEqual(lines, ['ééé', 'José ٣٤'])
+
+    def test_utf16_document_is_scanned(self):
+        path = make_docx(os.path.join(self.tmp.name, 'c.docx'), 'call PROMTINTO(x)', encoding='utf-16')
+        matched, lines = find(path, [r'PROMTINTO\('])
+        self.assertEqual(matched, [r'PROMTINTO\('])
+        self.assertEqual(lines, ['call PROMTINTO(x)'])
+
+
+if __name__ == '__main__':
+    unittest.main()